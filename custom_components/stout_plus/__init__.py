@@ -1,19 +1,50 @@
+from aiohttp import ClientSession, TCPConnector
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .api import StoutPlusApi
-from .const import DOMAIN, PLATFORMS, REQUEST_TIMEOUT
-from .coordinator import StoutPlusCoordinator
+from .const import (
+    CONNECTION_KEEPALIVE,
+    DOMAIN,
+    MAX_REQUESTS_PER_HOST,
+    PLATFORMS,
+    REQUEST_TIMEOUT,
+)
+from .coordinator import StoutPlusCoordinator, snapshot_store
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
+from .websocket import async_setup_websocket
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the services and websocket commands of the integration."""
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Stout Plus integration from a config entry."""
+    scheduler = async_get_scheduler(hass)
     api = StoutPlusApi(
-        async_get_clientsession(hass), entry.data["host"], REQUEST_TIMEOUT
+        _async_create_session(hass, entry),
+        entry.data["host"],
+        REQUEST_TIMEOUT,
+        scheduler.async_request_slot,
     )
-    coordinator = StoutPlusCoordinator(hass, entry, api)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = StoutPlusCoordinator(hass, entry, api, scheduler)
+    restored = await coordinator.async_restore()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_probe_capabilities()
+    # Entities start from the saved data while the boiler is read; the
+    # scheduler runs that read as a cycle, so no other cycle overlaps it.
+    scheduler.async_register(coordinator, immediate=restored)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
@@ -32,6 +63,44 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data saved for a config entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+
+
+def _async_create_session(hass: HomeAssistant, entry: ConfigEntry) -> ClientSession:
+    """Create a session that keeps its connections to the boiler alive.
+
+    Unlike the shared session, idle connections are held for longer than
+    the poll interval, so polls do not pay for a new TCP handshake each
+    time the embedded server is asked for data.
+    """
+    session = ClientSession(
+        connector=TCPConnector(
+            limit_per_host=MAX_REQUESTS_PER_HOST,
+            keepalive_timeout=CONNECTION_KEEPALIVE,
+            ssl=False,
+        )
+    )
+
+    async def _async_close_on_event(_event: Event) -> None:
+        nonlocal remove_listener
+        # The listener is gone once it fired; unloading must not remove it.
+        remove_listener = None
+        await session.close()
+
+    async def _async_close() -> None:
+        if remove_listener is not None:
+            remove_listener()
+        await session.close()
+
+    remove_listener: CALLBACK_TYPE | None = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_on_event
+    )
+    entry.async_on_unload(_async_close)
+    return session
+
+
 async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the integration after its configuration changes."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -3,41 +3,211 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from enum import StrEnum
 from typing import Any
 
 from aiohttp import ClientError, ClientSession
+from homeassistant.util.json import json_loads
+
+from .const import STRATEGY_TRIALS
+from .metrics import EndpointMetrics
+
+_UTF8 = frozenset({"utf-8", "utf8"})
 
 
 class StoutPlusApiError(Exception):
     """Base exception for communication with the boiler."""
 
 
+class StoutPlusPayloadError(StoutPlusApiError):
+    """The boiler answered with a body that is not a JSON object.
+
+    ``kind`` tells why: ``encoding``, ``invalid_json`` or ``not_object``.
+    """
+
+    def __init__(self, message: str, body: bytes, kind: str) -> None:
+        """Initialize the error with the offending body."""
+        super().__init__(message)
+        self.body = body
+        self.kind = kind
+
+
+class FetchStrategy(StrEnum):
+    """How the endpoints of one update are requested."""
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
+
+
 class StoutPlusApi:
     """Small asynchronous wrapper around the boiler HTTP interface."""
 
-    def __init__(self, session: ClientSession, host: str, timeout: int = 10) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session: ClientSession,
+        host: str,
+        timeout: int = 10,
+        request_slot: Callable[[str], AbstractAsyncContextManager[Any]] | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        ``request_slot`` is entered with the host around every request, so
+        callers can bound the number of concurrent requests.
+        """
         self._session = session
         self._host = host.strip().removeprefix("http://").rstrip("/")
         self._timeout = timeout
+        self._request_slot = request_slot or _unlimited
+        self._metrics: dict[str, EndpointMetrics] = {}
+        # Endpoint -> latest body and the object decoded from it.
+        self._decoded: dict[str, tuple[bytes, dict[str, Any]]] = {}
+        # None while the strategies are still being measured.
+        self.strategy: FetchStrategy | None = None
+        self._trials: dict[FetchStrategy, list[float]] = {
+            strategy: [] for strategy in FetchStrategy
+        }
 
     @property
     def host(self) -> str:
         """Return the normalized boiler host."""
         return self._host
 
+    def metrics(self, endpoint: str) -> EndpointMetrics:
+        """Return the request statistics of an endpoint."""
+        if (metrics := self._metrics.get(endpoint)) is None:
+            metrics = self._metrics[endpoint] = EndpointMetrics()
+        return metrics
+
+    def connection_diagnostics(self) -> dict[str, Any]:
+        """Return the fetch strategy and the measurements behind it."""
+        return {
+            "strategy": self.strategy,
+            # Seconds per request of each timed fetch; None if one failed.
+            "trials": {
+                strategy: [None if math.isinf(trial) else trial for trial in trials]
+                for strategy, trials in self._trials.items()
+            },
+        }
+
+    async def async_get_many(
+        self, endpoints: Sequence[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        """Fetch several endpoints, returning a payload or error for each.
+
+        Embedded servers often serve one connection at a time, so requests
+        sent together may just queue up or be reset. Until a strategy is
+        chosen, fetches of several endpoints alternate between sequential
+        requests over one kept-alive connection and concurrent requests,
+        timing each per request. After ``STRATEGY_TRIALS`` fetches each the
+        faster strategy is kept; a fetch with a failed request counts as
+        infinitely slow. Concurrent requests still wait for the per-host
+        request slots, so only that many are in flight at once; the trials
+        time the strategy as it is then actually run.
+        """
+        if len(endpoints) < 2:
+            return await self._async_get_sequential(endpoints)
+
+        strategy = self.strategy or min(
+            FetchStrategy, key=lambda strategy: len(self._trials[strategy])
+        )
+        started = time.perf_counter()
+        if strategy is FetchStrategy.CONCURRENT:
+            results = await asyncio.gather(
+                *(self.async_get(endpoint) for endpoint in endpoints),
+                return_exceptions=True,
+            )
+        else:
+            results = await self._async_get_sequential(endpoints)
+
+        if self.strategy is None:
+            failed = any(isinstance(result, BaseException) for result in results)
+            self._trials[strategy].append(
+                math.inf if failed else (time.perf_counter() - started) / len(endpoints)
+            )
+            if all(len(trials) >= STRATEGY_TRIALS for trials in self._trials.values()):
+                self.strategy = min(
+                    FetchStrategy,
+                    key=lambda strategy: statistics.median(self._trials[strategy]),
+                )
+        return results
+
+    async def _async_get_sequential(
+        self, endpoints: Sequence[str]
+    ) -> list[dict[str, Any] | BaseException]:
+        results: list[dict[str, Any] | BaseException] = []
+        for endpoint in endpoints:
+            try:
+                results.append(await self.async_get(endpoint))
+            except StoutPlusApiError as err:
+                results.append(err)
+        return results
+
     async def async_get(self, endpoint: str) -> dict[str, Any]:
-        """Fetch and decode a JSON endpoint."""
+        """Fetch and decode a JSON endpoint.
+
+        When the body is identical to the previous one, the object decoded
+        from it before is returned again, so callers can detect unchanged
+        payloads by identity. The returned object must not be modified.
+        """
+        metrics = self.metrics(endpoint)
+        async with self._request_slot(self._host):
+            started = time.perf_counter()
+            try:
+                body, encoding = await self._async_read(endpoint)
+                data = self._decode(endpoint, body, encoding)
+            except StoutPlusPayloadError as err:
+                metrics.record_parse_failure(
+                    time.perf_counter() - started, str(err), err.kind, err.body
+                )
+                raise
+            except StoutPlusApiError as err:
+                cause = err.__cause__
+                metrics.record_failure(
+                    time.perf_counter() - started,
+                    (str(cause) or type(cause).__name__) if cause else str(err),
+                )
+                raise
+            metrics.record_success(time.perf_counter() - started, body)
+        return data
+
+    async def _async_read(self, endpoint: str) -> tuple[bytes, str]:
+        """Return the raw body of an endpoint and its character encoding."""
         try:
             async with asyncio.timeout(self._timeout):
                 async with self._session.get(self._url(endpoint)) as response:
                     response.raise_for_status()
-                    data = await response.json(content_type=None)
-        except (TimeoutError, ClientError, ValueError) as err:
+                    return await response.read(), response.get_encoding()
+        except (TimeoutError, ClientError, LookupError) as err:
             raise StoutPlusApiError(f"GET {endpoint} failed: {err}") from err
 
+    def _decode(self, endpoint: str, body: bytes, encoding: str) -> dict[str, Any]:
+        """Decode a body, reusing the previous object if the body is unchanged."""
+        cached = self._decoded.get(endpoint)
+        if cached is not None and cached[0] == body:
+            return cached[1]
+
+        try:
+            data = json_loads(
+                body if encoding.lower() in _UTF8 else body.decode(encoding)
+            )
+        except UnicodeDecodeError as err:
+            raise StoutPlusPayloadError(
+                f"GET {endpoint} failed: {err}", body, "encoding"
+            ) from err
+        except ValueError as err:
+            raise StoutPlusPayloadError(
+                f"GET {endpoint} failed: {err}", body, "invalid_json"
+            ) from err
         if not isinstance(data, dict):
-            raise StoutPlusApiError(f"GET {endpoint} returned invalid data")
+            raise StoutPlusPayloadError(
+                f"GET {endpoint} returned invalid data", body, "not_object"
+            )
+        self._decoded[endpoint] = (body, data)
         return data
 
     async def async_post_text(self, endpoint: str, value: str) -> None:
@@ -60,7 +230,7 @@ class StoutPlusApi:
         headers: dict[str, str] | None = None,
     ) -> None:
         try:
-            async with asyncio.timeout(self._timeout):
+            async with self._request_slot(self._host), asyncio.timeout(self._timeout):
                 async with self._session.post(
                     self._url(endpoint), data=data, headers=headers
                 ) as response:
@@ -70,3 +240,7 @@ class StoutPlusApi:
 
     def _url(self, endpoint: str) -> str:
         return f"http://{self._host}/{endpoint.lstrip('/')}"
+
+
+def _unlimited(_host: str) -> AbstractAsyncContextManager[None]:
+    return nullcontext()
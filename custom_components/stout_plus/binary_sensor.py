@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Literal
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -17,7 +17,8 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
+from .snapshot import FieldFlag
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -114,8 +115,10 @@ async def async_setup_entry(
     """Set up binary sensor entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        StoutPlusBinarySensor(coordinator, entry.entry_id, description)
-        for description in BINARY_SENSORS
+        supported_entities(
+            StoutPlusBinarySensor(coordinator, entry.entry_id, description)
+            for description in BINARY_SENSORS
+        )
     )
 
 
@@ -133,27 +136,30 @@ class StoutPlusBinarySensor(StoutPlusEntity, BinarySensorEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._endpoint = description.endpoint
+        self._source_keys = ((description.endpoint, description.source_key),)
+        if description.value_kind == "problem":
+            self._source_keys += (("main", "Err_Lst"), ("main", "Err_Rel_Lst"))
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
 
     @property
     def is_on(self) -> bool | None:
-        raw_value: Any = self.coordinator.data[self.entity_description.endpoint].get(
-            self.entity_description.source_key
+        data = self.coordinator.data
+        field = data.field(
+            self.entity_description.endpoint, self.entity_description.source_key
         )
-        if raw_value is None:
+        if field.raw is None:
             return None
 
-        value = str(raw_value)
         if self.entity_description.value_kind == "connected":
-            return "Подключен" in value and "Отключен" not in value
+            return field.flag is FieldFlag.CONNECTED
         if self.entity_description.value_kind == "rtc":
-            return "Работают" in value
+            return field.flag is FieldFlag.RUNNING
         if self.entity_description.value_kind == "pump":
-            try:
-                status = int(raw_value)
-            except (TypeError, ValueError):
+            if (status := field.integer) is None:
                 return None
             return bool(status & 0x1) if status & 0x2 else None
-        main = self.coordinator.data["main"]
-        error_lists = f"{main.get('Err_Lst', '')} {main.get('Err_Rel_Lst', '')}".strip()
-        return bool(error_lists) or "без ошибок" not in value.lower()
+        return (
+            data.field("main", "Err_Lst").text is not None
+            or data.field("main", "Err_Rel_Lst").text is not None
+            or field.flag is not FieldFlag.NO_ERRORS
+        )
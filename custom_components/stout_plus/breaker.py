@@ -0,0 +1,58 @@
+"""Per-endpoint circuit breaker for the Stout Plus coordinator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import BREAKER_INITIAL_BACKOFF, BREAKER_MAX_BACKOFF, BREAKER_THRESHOLD
+
+
+class EndpointBreaker:
+    """Skip an endpoint that keeps failing, probing it with growing delays.
+
+    After ``BREAKER_THRESHOLD`` consecutive failures the breaker opens and
+    the endpoint is only tried again once its backoff has passed. Each failed
+    probe doubles the backoff up to ``BREAKER_MAX_BACKOFF``; one success
+    closes the breaker.
+    """
+
+    __slots__ = ("backoff", "failures", "retry_at")
+
+    def __init__(self) -> None:
+        """Initialize a closed breaker."""
+        self.failures = 0
+        self.backoff = 0.0
+        self.retry_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the endpoint is being skipped or probed."""
+        return self.failures >= BREAKER_THRESHOLD
+
+    def allows(self, now: float) -> bool:
+        """Return whether the endpoint may be requested at ``now``."""
+        return now >= self.retry_at
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.backoff = 0.0
+        self.retry_at = 0.0
+
+    def record_failure(self, now: float) -> None:
+        """Count a failure and open the breaker once the threshold is hit."""
+        self.failures += 1
+        if self.is_open:
+            self.backoff = min(
+                self.backoff * 2 or BREAKER_INITIAL_BACKOFF, BREAKER_MAX_BACKOFF
+            )
+            self.retry_at = now + self.backoff
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": "open" if self.is_open else "closed",
+            "failures": self.failures,
+            "backoff": self.backoff,
+            "retry_in": max(self.retry_at - now, 0.0),
+        }
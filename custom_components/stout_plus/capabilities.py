@@ -0,0 +1,74 @@
+"""Fields exposed by each Stout Plus firmware version."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import CAPABILITIES_STORAGE_VERSION, DATA_CAPABILITIES, DOMAIN, ENDPOINTS
+from .snapshot import StoutPlusSnapshot
+
+# Fields that together identify the firmware of a boiler.
+FIRMWARE_KEYS = (
+    ("additional", "boilerControllerSoft"),
+    ("additional", "boilerRemoteSoft"),
+)
+
+
+def firmware_version(data: StoutPlusSnapshot) -> str | None:
+    """Return the firmware versions of the controller and remote, if reported."""
+    versions = [data.field(endpoint, key).text for endpoint, key in FIRMWARE_KEYS]
+    if not any(versions):
+        return None
+    return " / ".join(version or "" for version in versions)
+
+
+@callback
+def async_get_capabilities(hass: HomeAssistant) -> FirmwareCapabilities:
+    """Return the capability cache shared by every config entry."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (capabilities := data.get(DATA_CAPABILITIES)) is None:
+        capabilities = data[DATA_CAPABILITIES] = FirmwareCapabilities(hass)
+    return capabilities
+
+
+class FirmwareCapabilities:
+    """Keys each endpoint returns, recorded once per firmware version.
+
+    The keys are taken from the first snapshot of a firmware version in
+    which every endpoint answered, and saved for all boilers running it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, dict[str, list[str]]]] = Store(
+            hass, CAPABILITIES_STORAGE_VERSION, f"{DOMAIN}.capabilities"
+        )
+        self._load_lock = asyncio.Lock()
+        self._versions: dict[str, dict[str, list[str]]] | None = None
+
+    async def async_probe(
+        self, data: StoutPlusSnapshot
+    ) -> Mapping[str, frozenset[str]] | None:
+        """Return the keys per endpoint of the boiler's firmware.
+
+        Return None while they are unknown, i.e. the firmware is not
+        reported or not every endpoint answered yet.
+        """
+        if (firmware := firmware_version(data)) is None:
+            return None
+        async with self._load_lock:
+            if self._versions is None:
+                self._versions = await self._store.async_load() or {}
+
+        if (keys := self._versions.get(firmware)) is None:
+            if data.available != frozenset(ENDPOINTS):
+                return None
+            keys = self._versions[firmware] = {
+                endpoint: sorted(data.raw[endpoint]) for endpoint in ENDPOINTS
+            }
+            await self._store.async_save(self._versions)
+        return {endpoint: frozenset(names) for endpoint, names in keys.items()}
@@ -15,7 +15,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .api import StoutPlusApiError
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
 
 
 async def async_setup_entry(
@@ -26,9 +26,11 @@ async def async_setup_entry(
     """Set up climate entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        (
-            BoilerClimateEntity(coordinator, entry.entry_id),
-            RoomClimateEntity(coordinator, entry.entry_id),
+        supported_entities(
+            (
+                BoilerClimateEntity(coordinator, entry.entry_id),
+                RoomClimateEntity(coordinator, entry.entry_id),
+            )
         )
     )
 
@@ -46,14 +48,15 @@ class StoutPlusClimateEntity(StoutPlusEntity, ClimateEntity):
     _attr_target_temperature_step = 0.1
     _endpoint = "main"
 
-    async def _async_post(self, endpoint: str, value: str) -> None:
+    async def _async_post(self, command: str, key: str, value: str) -> None:
         try:
-            await self.coordinator.api.async_post_text(endpoint, value)
+            await self.coordinator.writer.async_send_text(
+                command, f"[{value}]", {("main", key): value}
+            )
         except StoutPlusApiError as err:
             raise HomeAssistantError(
                 "Could not send the command to the Stout Plus boiler"
             ) from err
-        await self.coordinator.async_request_refresh()
 
 
 class BoilerClimateEntity(StoutPlusClimateEntity):
@@ -62,6 +65,11 @@ class BoilerClimateEntity(StoutPlusClimateEntity):
     _attr_translation_key = "boiler_temperature"
     _attr_min_temp = 15.0
     _attr_max_temp = 40.0
+    _source_keys = (
+        ("main", "ActValTempCarrier"),
+        ("main", "SetTempCarrier"),
+        ("main", "setMode"),
+    )
 
     def __init__(self, coordinator: StoutPlusCoordinator, entry_id: str) -> None:
         super().__init__(coordinator, entry_id)
@@ -69,27 +77,27 @@ class BoilerClimateEntity(StoutPlusClimateEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        return _as_float(self.coordinator.data["main"].get("ActValTempCarrier"))
+        return self.coordinator.data.field("main", "ActValTempCarrier").number
 
     @property
     def target_temperature(self) -> float | None:
-        return _as_float(self.coordinator.data["main"].get("SetTempCarrier"))
+        return self.coordinator.data.field("main", "SetTempCarrier").number
 
     @property
     def hvac_mode(self) -> HVACMode:
         return (
             HVACMode.HEAT
-            if _as_int(self.coordinator.data["main"].get("setMode")) == 0
+            if self.coordinator.data.field("main", "setMode").integer == 0
             else HVACMode.OFF
         )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            await self._async_post("change_crrtrg", f"[{temperature}]")
+            await self._async_post("change_crrtrg", "SetTempCarrier", f"{temperature}")
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        value = "[0]" if hvac_mode == HVACMode.HEAT else "[4]"
-        await self._async_post("switch_mode", value)
+        value = "0" if hvac_mode == HVACMode.HEAT else "4"
+        await self._async_post("switch_mode", "setMode", value)
 
 
 class RoomClimateEntity(StoutPlusClimateEntity):
@@ -98,6 +106,11 @@ class RoomClimateEntity(StoutPlusClimateEntity):
     _attr_translation_key = "room_temperature"
     _attr_min_temp = 18.0
     _attr_max_temp = 28.0
+    _source_keys = (
+        ("main", "TempInRoom"),
+        ("main", "setTempRoomMode"),
+        ("main", "setMode"),
+    )
 
     def __init__(self, coordinator: StoutPlusCoordinator, entry_id: str) -> None:
         super().__init__(coordinator, entry_id)
@@ -105,38 +118,24 @@ class RoomClimateEntity(StoutPlusClimateEntity):
 
     @property
     def current_temperature(self) -> float | None:
-        return _as_float(self.coordinator.data["main"].get("TempInRoom"))
+        return self.coordinator.data.field("main", "TempInRoom").number
 
     @property
     def target_temperature(self) -> float | None:
-        return _as_float(self.coordinator.data["main"].get("setTempRoomMode"))
+        return self.coordinator.data.field("main", "setTempRoomMode").number
 
     @property
     def hvac_mode(self) -> HVACMode:
         return (
             HVACMode.HEAT
-            if _as_int(self.coordinator.data["main"].get("setMode")) == 2
+            if self.coordinator.data.field("main", "setMode").integer == 2
             else HVACMode.OFF
         )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            await self._async_post("change_rmtrg", f"[{temperature}]")
+            await self._async_post("change_rmtrg", "setTempRoomMode", f"{temperature}")
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        value = "[2]" if hvac_mode == HVACMode.HEAT else "[4]"
-        await self._async_post("switch_mode", value)
-
-
-def _as_float(value: Any) -> float | None:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _as_int(value: Any) -> int | None:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
+        value = "2" if hvac_mode == HVACMode.HEAT else "4"
+        await self._async_post("switch_mode", "setMode", value)
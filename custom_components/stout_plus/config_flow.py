@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+from ipaddress import ip_network
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import discovery_flow
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import StoutPlusApi, StoutPlusApiError
-from .const import DOMAIN, REQUEST_TIMEOUT
+from .const import (
+    CONF_FAST_POLL_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_NETWORK,
+    CONF_PUBLISH_HEARTBEAT,
+    CONF_SLOW_POLL_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_FAST_POLL_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PUBLISH_HEARTBEAT,
+    DEFAULT_SLOW_POLL_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    MAX_MIN_PUBLISH_INTERVAL,
+    MAX_POLL_INTERVAL,
+    MAX_PUBLISH_HEARTBEAT,
+    MAX_SCAN_ADDRESSES,
+    MAX_STALE_GRACE_PERIOD,
+    MIN_POLL_INTERVAL,
+    MIN_PUBLISH_HEARTBEAT,
+    REQUEST_TIMEOUT,
+)
+from .discovery import async_get_probe_cache, async_scan_network
 
 if TYPE_CHECKING:
     from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
@@ -26,11 +51,19 @@ class StoutPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovered_host: str | None = None
         self._discovered_name: str | None = None
+        self._scan_task: asyncio.Task[list[str]] | None = None
+        self._scanned_hosts: list[str] = []
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle setup initiated by the user."""
+        """Let the user enter a boiler address or scan a network range."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a boiler address entered by the user."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -45,7 +78,77 @@ class StoutPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "cannot_connect"
 
         schema = vol.Schema({vol.Required(CONF_HOST): vol.All(str, _normalize_host)})
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="manual", data_schema=schema, errors=errors)
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a network range for boilers that are not configured yet."""
+        errors: dict[str, str] = {}
+
+        if self._scan_task is None and user_input is not None:
+            try:
+                network = ip_network(user_input[CONF_NETWORK], strict=False)
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                if network.num_addresses > MAX_SCAN_ADDRESSES:
+                    errors["base"] = "network_too_large"
+                else:
+                    configured = {
+                        entry.data[CONF_HOST]
+                        for entry in self._async_current_entries()
+                        if CONF_HOST in entry.data
+                    }
+                    self._scan_task = self.hass.async_create_task(
+                        async_scan_network(
+                            async_get_clientsession(self.hass), network, configured
+                        ),
+                        f"{DOMAIN} scan {network}",
+                    )
+
+        if self._scan_task is None:
+            schema = vol.Schema({vol.Required(CONF_NETWORK): str})
+            return self.async_show_form(
+                step_id="scan", data_schema=schema, errors=errors
+            )
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="scan", progress_action="scan", progress_task=self._scan_task
+            )
+        self._scanned_hosts = self._scan_task.result()
+        return self.async_show_progress_done(next_step_id="scan_done")
+
+    async def async_step_scan_done(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Offer every boiler found by the scan as a discovered device."""
+        hosts = self._scanned_hosts
+        for host in hosts:
+            discovery_flow.async_create_flow(
+                self.hass,
+                DOMAIN,
+                context={"source": config_entries.SOURCE_INTEGRATION_DISCOVERY},
+                data={CONF_HOST: host},
+            )
+        if not hosts:
+            return self.async_abort(reason="no_devices_found")
+        return self.async_abort(
+            reason="scan_complete", description_placeholders={"count": str(len(hosts))}
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Handle a boiler found by a network scan."""
+        host = discovery_info[CONF_HOST]
+        self._async_abort_entries_match({CONF_HOST: host})
+        await self.async_set_unique_id(host.lower())
+        self._abort_if_unique_id_configured()
+
+        self._discovered_host = self._discovered_name = host
+        self.context["title_placeholders"] = {"name": host}
+        return await self.async_step_zeroconf_confirm()
 
     async def async_step_zeroconf(
         self, discovery_info: ZeroconfServiceInfo
@@ -55,12 +158,17 @@ class StoutPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         name = discovery_info.name.partition("._http._tcp.local.")[0]
 
         self._async_abort_entries_match({CONF_HOST: host})
-        if not await self._async_test_connection(host):
-            return self.async_abort(reason="cannot_connect")
-
+        # A known boiler only needs its address updated, without a request.
         await self.async_set_unique_id(name.lower())
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
 
+        probes = async_get_probe_cache(self.hass)
+        if (reachable := probes.get(host, name)) is None:
+            reachable = await self._async_test_connection(host)
+            probes.set(host, name, reachable)
+        if not reachable:
+            return self.async_abort(reason="cannot_connect")
+
         self._discovered_host = host
         self._discovered_name = name
         self.context["title_placeholders"] = {"name": name}
@@ -102,7 +210,7 @@ class StoutPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
 
 class StoutPlusOptionsFlowHandler(config_entries.OptionsFlow):
-    """Allow the boiler address to be changed."""
+    """Allow the boiler address, polling and publishing to be changed."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._config_entry = config_entry
@@ -118,22 +226,80 @@ class StoutPlusOptionsFlowHandler(config_entries.OptionsFlow):
             api = StoutPlusApi(
                 async_get_clientsession(self.hass), host, REQUEST_TIMEOUT
             )
-            try:
-                await api.async_get("main_params")
-            except StoutPlusApiError:
-                errors["base"] = "cannot_connect"
+            if (
+                user_input[CONF_SLOW_POLL_INTERVAL]
+                < user_input[CONF_FAST_POLL_INTERVAL]
+            ):
+                errors["base"] = "invalid_poll_intervals"
             else:
+                try:
+                    await api.async_get("main_params")
+                except StoutPlusApiError:
+                    errors["base"] = "cannot_connect"
+            if not errors:
                 self.hass.config_entries.async_update_entry(
                     self._config_entry,
                     data={**self._config_entry.data, CONF_HOST: host},
                 )
-                return self.async_create_entry(title="", data={})
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        CONF_FAST_POLL_INTERVAL: user_input[CONF_FAST_POLL_INTERVAL],
+                        CONF_SLOW_POLL_INTERVAL: user_input[CONF_SLOW_POLL_INTERVAL],
+                        CONF_MIN_PUBLISH_INTERVAL: user_input[
+                            CONF_MIN_PUBLISH_INTERVAL
+                        ],
+                        CONF_PUBLISH_HEARTBEAT: user_input[CONF_PUBLISH_HEARTBEAT],
+                        CONF_STALE_GRACE_PERIOD: user_input[CONF_STALE_GRACE_PERIOD],
+                    },
+                )
 
+        options = self._config_entry.options
+        interval = vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_POLL_INTERVAL, max=MAX_POLL_INTERVAL)
+        )
         schema = vol.Schema(
             {
                 vol.Required(
                     CONF_HOST, default=self._config_entry.data[CONF_HOST]
-                ): vol.All(str, _normalize_host)
+                ): vol.All(str, _normalize_host),
+                vol.Required(
+                    CONF_FAST_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_FAST_POLL_INTERVAL, DEFAULT_FAST_POLL_INTERVAL
+                    ),
+                ): interval,
+                vol.Required(
+                    CONF_SLOW_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_SLOW_POLL_INTERVAL, DEFAULT_SLOW_POLL_INTERVAL
+                    ),
+                ): interval,
+                vol.Required(
+                    CONF_MIN_PUBLISH_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                    ),
+                ): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=MAX_MIN_PUBLISH_INTERVAL)
+                ),
+                vol.Required(
+                    CONF_PUBLISH_HEARTBEAT,
+                    default=options.get(
+                        CONF_PUBLISH_HEARTBEAT, DEFAULT_PUBLISH_HEARTBEAT
+                    ),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_PUBLISH_HEARTBEAT, max=MAX_PUBLISH_HEARTBEAT),
+                ),
+                vol.Required(
+                    CONF_STALE_GRACE_PERIOD,
+                    default=options.get(
+                        CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+                    ),
+                ): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=MAX_STALE_GRACE_PERIOD)
+                ),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -7,4 +7,116 @@ PLATFORMS = ["binary_sensor", "climate", "number", "sensor", "select", "switch",
 
 DEFAULT_NAME = "Stout Plus"
 REQUEST_TIMEOUT = 10
-UPDATE_INTERVAL = timedelta(seconds=10)
+
+# Network range scanned for boilers without mDNS, the largest accepted range,
+# hosts probed at once and the per-host timeout in seconds.
+CONF_NETWORK = "network"
+MAX_SCAN_ADDRESSES = 1024
+SCAN_CONCURRENCY = 32
+SCAN_TIMEOUT = 2
+
+# hass.data[DOMAIN] key of the results of probing announced boilers, and
+# seconds a successful and a failed probe are reused.
+DATA_PROBES = "probes"
+PROBE_TTL = 600
+PROBE_FAILURE_TTL = 60
+
+# Poll intervals in seconds while the boiler is busy and while it idles.
+CONF_FAST_POLL_INTERVAL = "fast_poll_interval"
+CONF_SLOW_POLL_INTERVAL = "slow_poll_interval"
+DEFAULT_FAST_POLL_INTERVAL = 10
+DEFAULT_SLOW_POLL_INTERVAL = 60
+MIN_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 600
+# Default seconds a noisy measurement waits after a state write before the
+# next one, and after which a held back value is written anyway.
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_PUBLISH_HEARTBEAT = "publish_heartbeat"
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_PUBLISH_HEARTBEAT = 900
+MAX_MIN_PUBLISH_INTERVAL = 3600
+MIN_PUBLISH_HEARTBEAT = 60
+MAX_PUBLISH_HEARTBEAT = 86400
+# Seconds the last good values of a failing endpoint are kept before its
+# entities become unavailable.
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+DEFAULT_STALE_GRACE_PERIOD = 120
+MAX_STALE_GRACE_PERIOD = 3600
+# Keep polling fast for this long after a write.
+WRITE_ACTIVITY_HOLD = timedelta(minutes=5)
+# Carrier temperature change (°C) between polls below which an idle boiler
+# counts as steady.
+STEADY_TEMPERATURE_DELTA = 0.5
+# ``setMode`` index of the antifreeze mode.
+ANTIFREEZE_MODE = 4
+# Seconds to wait for further writes of a command before sending it.
+WRITE_DEBOUNCE = 0.5
+# Reads of the written keys' endpoints until the boiler reports a write, and
+# seconds between them.
+WRITE_VERIFY_ATTEMPTS = 3
+WRITE_VERIFY_DELAY = 0.5
+
+# hass.data[DOMAIN] key of the poll scheduler shared by all config entries.
+DATA_SCHEDULER = "scheduler"
+# Requests in flight across all boilers, and to a single boiler.
+MAX_REQUESTS_IN_FLIGHT = 16
+MAX_REQUESTS_PER_HOST = 2
+# Seconds an idle connection to a boiler is kept open for reuse.
+CONNECTION_KEEPALIVE = 75
+# Multi-endpoint fetches timed per strategy before the faster one is kept.
+STRATEGY_TRIALS = 3
+
+# Consecutive failures after which an endpoint is skipped, and the bounds of
+# the exponentially growing delay (seconds) between probes of it.
+BREAKER_THRESHOLD = 3
+BREAKER_INITIAL_BACKOFF = 30
+BREAKER_MAX_BACKOFF = 1800
+
+# Number of latest requests per endpoint the latency statistics cover.
+METRICS_WINDOW = 64
+# Latest raw responses per endpoint and update cycles kept for diagnostics.
+DIAGNOSTICS_RESPONSES = 5
+DIAGNOSTICS_CYCLES = 32
+
+# Storage version of the last known snapshot, and the minimum seconds
+# between two saves of it.
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+
+# hass.data[DOMAIN] key of the firmware capability cache, and its version.
+DATA_CAPABILITIES = "capabilities"
+CAPABILITIES_STORAGE_VERSION = 1
+
+# hass.data[DOMAIN] key of the saved boiler profiles, and their version.
+DATA_PROFILES = "profiles"
+PROFILES_STORAGE_VERSION = 1
+
+# hass.data[DOMAIN] key of the websocket subscriptions to each config entry.
+DATA_SUBSCRIPTIONS = "subscriptions"
+
+# Numeric fields kept in the in-memory history, by name, and the
+# number of updates it holds: a day at the default fast poll interval.
+HISTORY_FIELDS = {
+    "boiler_water_temperature": ("main", "ActValTempCarrier"),
+    "room_temperature": ("main", "TempInRoom"),
+    "outdoor_temperature": ("main", "TempOutAir"),
+    "dhw_temperature": ("main", "temperatureOfDHW"),
+    "pressure": ("other", "ActPress"),
+    "power": ("other", "CurrPwr_str"),
+    "power_stages": ("other", "PowerLevels_str"),
+}
+HISTORY_SAMPLES = 8640
+
+# Coordinator data key -> HTTP endpoint of the boiler.
+ENDPOINTS = {
+    "main": "main_params",
+    "other": "other_params",
+    "additional": "additional_params",
+}
+# How often each endpoint is re-read; ``main`` follows the poll interval.
+# ``additional`` mostly holds firmware strings and limits, so it changes far
+# less often than the live values.
+ENDPOINT_UPDATE_INTERVALS = {
+    "other": timedelta(seconds=60),
+    "additional": timedelta(minutes=15),
+}
@@ -4,23 +4,89 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
+from collections import deque
+from collections.abc import Mapping
+from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import StoutPlusApi, StoutPlusApiError
-from .const import DOMAIN, UPDATE_INTERVAL
+from .breaker import EndpointBreaker
+from .capabilities import async_get_capabilities, firmware_version
+from .const import (
+    ANTIFREEZE_MODE,
+    CONF_FAST_POLL_INTERVAL,
+    CONF_SLOW_POLL_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_FAST_POLL_INTERVAL,
+    DEFAULT_SLOW_POLL_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DIAGNOSTICS_CYCLES,
+    DOMAIN,
+    ENDPOINT_UPDATE_INTERVALS,
+    ENDPOINTS,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    STEADY_TEMPERATURE_DELTA,
+    WRITE_ACTIVITY_HOLD,
+)
+from .history import StoutPlusHistory
+from .scheduler import StoutPlusScheduler
+from .snapshot import FieldFlag, StoutPlusField, StoutPlusSnapshot
+from .writer import FieldUpdates, StoutPlusWriter
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class StoutPlusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Fetch all boiler endpoints once per update cycle."""
+@callback
+def async_get_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> StoutPlusCoordinator | None:
+    """Return the coordinator of a loaded config entry."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    return coordinator if isinstance(coordinator, StoutPlusCoordinator) else None
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store of the last known payloads of a boiler."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+class StoutPlusCoordinator(DataUpdateCoordinator[StoutPlusSnapshot]):
+    """Fetch the boiler endpoints that are due in each update cycle.
+
+    Every endpoint has its own refresh interval. Endpoints that are not due
+    keep the values from their latest successful read. The payloads are
+    decoded once per update into a :class:`StoutPlusSnapshot`, and listeners
+    are only notified when one of their source fields changed.
+
+    Writes may overlay optimistic values on the polled data until the
+    affected endpoint has been read again. Scheduled updates are driven by
+    the shared :class:`StoutPlusScheduler` every ``poll_interval``, which
+    is short while the boiler is busy and long while it idles.
+
+    When an endpoint fails, its last good values are kept for the stale
+    grace period, so a single failed poll does not make its entities
+    unavailable; they become unavailable once the period ran out.
+
+    The latest payloads are saved at most every ``SNAPSHOT_SAVE_DELAY``
+    seconds, so a restart can start from them before the boiler answers.
+    A change of the reported firmware reloads the config entry, so the
+    entities follow the fields the new firmware exposes.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, entry: ConfigEntry, api: StoutPlusApi
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: StoutPlusApi,
+        scheduler: StoutPlusScheduler,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -28,34 +94,419 @@ class StoutPlusCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             config_entry=entry,
             name=DOMAIN,
-            update_interval=UPDATE_INTERVAL,
             always_update=False,
         )
         self.api = api
+        self.scheduler = scheduler
+        self._fast_interval = timedelta(
+            seconds=entry.options.get(
+                CONF_FAST_POLL_INTERVAL, DEFAULT_FAST_POLL_INTERVAL
+            )
+        )
+        self._slow_interval = timedelta(
+            seconds=entry.options.get(
+                CONF_SLOW_POLL_INTERVAL, DEFAULT_SLOW_POLL_INTERVAL
+            )
+        )
+        self._stale_grace = entry.options.get(
+            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+        )
+        self.poll_interval = self._fast_interval
+        self.cycle_duration: float | None = None
+        # State writes held back by the publishing policies of the sensors.
+        self.suppressed_writes = 0
+        self.history = StoutPlusHistory()
+        # (wall clock time, duration, endpoints read, failed endpoints)
+        self.cycles: deque[tuple[float, float, tuple[str, ...], int]] = deque(
+            maxlen=DIAGNOSTICS_CYCLES
+        )
+        self._last_write = -math.inf
+        self._carrier_temperature: float | None = None
+        self.writer = StoutPlusWriter(self)
+        # Held by every refresh, so an older read never overwrites a newer one.
+        self._refresh_lock = asyncio.Lock()
+        # Monotonic time from which a cycle reads each endpoint again.
+        self._next_update: dict[str, float] = dict.fromkeys(ENDPOINTS, 0.0)
+        self._breakers = {name: EndpointBreaker() for name in ENDPOINTS}
+        self._raw: dict[str, dict[str, Any]] = {name: {} for name in ENDPOINTS}
+        self._available: set[str] = set(ENDPOINTS)
+        # Monotonic and wall clock time of the latest successful read.
+        self._last_success: dict[str, float] = dict.fromkeys(ENDPOINTS, -math.inf)
+        self._last_read: dict[str, float | None] = dict.fromkeys(ENDPOINTS)
+        self._read_errors: dict[str, StoutPlusApiError] = {}
+        self._optimistic: dict[str, dict[str, str]] = {}
+        self._notified_data: StoutPlusSnapshot | None = None
+        self._notified_success = True
+        self._store = snapshot_store(hass, entry.entry_id)
+        self._save_pending = False
+        self._stale = False
+        self.firmware: str | None = None
+        # Endpoint -> keys the firmware returns; None while unknown.
+        self.capabilities: Mapping[str, frozenset[str]] | None = None
+        self._probing = False
+
+    async def async_restore(self) -> bool:
+        """Load the payloads saved by a previous run as stale data.
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        endpoint_names = ("main", "other", "additional")
-        results = await asyncio.gather(
-            self.api.async_get("main_params"),
-            self.api.async_get("other_params"),
-            self.api.async_get("additional_params"),
-            return_exceptions=True,
+        Return whether any were found, in which case the entities can be set
+        up from them while the boiler is read in the background.
+        """
+        stored = await self._store.async_load()
+        raw = {
+            name: payload
+            for name, payload in (stored or {}).get("raw", {}).items()
+            if name in ENDPOINTS
+        }
+        if not raw:
+            return False
+        self._raw.update(raw)
+        self._available = set(raw)
+        self._stale = True
+        self.data = self._build_snapshot()
+        return True
+
+    async def async_probe_capabilities(self) -> None:
+        """Look up the fields the boiler's firmware exposes."""
+        self.firmware = firmware_version(self.data)
+        self.capabilities = await async_get_capabilities(self.hass).async_probe(
+            self.data
         )
 
-        data: dict[str, Any] = {"_available": set()}
+    def supports(self, endpoint: str, key: str) -> bool:
+        """Return whether the firmware exposes a field, or is not known yet."""
+        return self.capabilities is None or key in self.capabilities.get(endpoint, ())
+
+    @callback
+    def async_invalidate(self, *endpoints: str) -> None:
+        """Re-read the given endpoints, or all of them, on the next update."""
+        for endpoint in endpoints or ENDPOINTS:
+            self._next_update[endpoint] = 0.0
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose source fields changed since the last call.
+
+        Entities pass their ``(endpoint, key)`` pairs as the listener context.
+        Listeners without a context, and every listener after a change of the
+        update status, are always notified.
+        """
+        data, previous = self.data, self._notified_data
+        self._notified_data = data
+        if (
+            data is None
+            or previous is None
+            or self.last_update_success != self._notified_success
+            or data.stale != previous.stale
+        ):
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        changed_keys = data.changed_keys(previous)
+        changed_endpoints = data.available ^ previous.available
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or any(
+                key in changed_keys or key[0] in changed_endpoints for key in context
+            ):
+                update_callback()
+
+    async def async_refresh(self) -> None:
+        """Refresh the data once no other refresh is running."""
+        async with self._refresh_lock:
+            await super().async_refresh()
+
+    async def async_refresh_endpoints(self, *endpoints: str) -> None:
+        """Re-read the given endpoints now, bypassing the refresh debouncer.
+
+        The endpoints are invalidated once a running refresh finished, so
+        they are read after it rather than marked as read by it.
+        """
+        async with self._refresh_lock:
+            self.async_invalidate(*endpoints)
+            await super().async_refresh()
+
+    def is_current(self, updates: FieldUpdates) -> bool:
+        """Return whether the boiler last reported every value in ``updates``."""
+        return bool(updates) and all(
+            StoutPlusField(self._raw[endpoint].get(key)).matches(value)
+            if key in self._optimistic.get(endpoint, {})
+            else self.data.field(endpoint, key).matches(value)
+            for (endpoint, key), value in updates.items()
+        )
+
+    @callback
+    def async_set_optimistic(self, updates: FieldUpdates) -> None:
+        """Show the values of a pending write until the boiler reports them."""
+        for (endpoint, key), value in updates.items():
+            self._optimistic.setdefault(endpoint, {})[key] = value
+        self._last_write = time.monotonic()
+        self._async_set_poll_interval(self._fast_interval)
+        self._async_publish()
+
+    @callback
+    def async_clear_optimistic(
+        self, updates: FieldUpdates, *, publish: bool = True
+    ) -> None:
+        """Drop the optimistic values of a write that was sent or failed.
+
+        Without ``publish`` the values stay visible until the next update,
+        which is expected to bring the confirmed values.
+        """
+        for (endpoint, key), value in updates.items():
+            values = self._optimistic.get(endpoint, {})
+            # A newer write of the same key keeps its own value.
+            if values.get(key) == value:
+                del values[key]
+                if not values:
+                    del self._optimistic[endpoint]
+        if publish:
+            self._async_publish()
+
+    async def async_shutdown(self) -> None:
+        """Drop queued writes and stop updating."""
+        self.scheduler.async_unregister(self)
+        self.writer.async_cancel()
+        await super().async_shutdown()
+
+    async def _async_update_data(self) -> StoutPlusSnapshot:
+        now = time.monotonic()
+        due = [
+            name
+            for name, when in self._next_update.items()
+            if when <= now and self._breakers[name].allows(now)
+        ]
+        results = await self.api.async_get_many([ENDPOINTS[name] for name in due])
+
         errors: list[StoutPlusApiError] = []
-        for name, result in zip(endpoint_names, results, strict=True):
+        for name, result in zip(due, results, strict=True):
+            # A failed endpoint keeps its past deadline, so it is tried again
+            # as soon as its breaker allows, while the others keep their own
+            # intervals.
             if isinstance(result, StoutPlusApiError):
-                data[name] = {}
+                self._breakers[name].record_failure(now)
+                self._read_errors[name] = result
                 errors.append(result)
             else:
-                data[name] = result
-                data["_available"].add(name)
+                self._breakers[name].record_success()
+                self._read_errors.pop(name, None)
+                self._raw[name] = result
+                self._available.add(name)
+                self._last_success[name] = now
+                self._last_read[name] = time.time()
+                interval = ENDPOINT_UPDATE_INTERVALS.get(name, self.poll_interval)
+                self._next_update[name] = self._read_from(now, interval)
 
-        if len(errors) == len(endpoint_names):
-            raise UpdateFailed(f"Error communicating with boiler: {errors[0]}")
+        self._expire_stale(now)
+        self._record_cycle(now, due, len(errors))
+        if not self._available:
+            # Endpoints behind an open breaker are not requested at all.
+            reason = errors[0] if errors else "all endpoints are backing off"
+            raise UpdateFailed(f"Error communicating with boiler: {reason}")
+        self._stale = False
+        data = self._build_snapshot()
+        if data is not self.data:
+            self._async_schedule_save()
+            self._async_check_firmware(data)
+        self.history.record(time.time(), data)
+        self._async_set_poll_interval(self._activity_interval(data))
         return data
 
+    def _expire_stale(self, now: float) -> None:
+        """Drop the values of failing endpoints once their grace period ran out."""
+        for name, breaker in self._breakers.items():
+            if (
+                breaker.failures
+                and name in self._available
+                and now - self._last_success[name] >= self._stale_grace
+            ):
+                _LOGGER.debug(
+                    "No valid %s data for %s seconds", name, self._stale_grace
+                )
+                self._raw[name] = {}
+                self._available.discard(name)
+
+    @callback
+    def _async_check_firmware(self, data: StoutPlusSnapshot) -> None:
+        if "additional" not in data.available:
+            return
+        if self.capabilities is None:
+            if not self._probing and firmware_version(data) is not None:
+                self._probing = True
+                entry = self.config_entry
+                entry.async_create_background_task(
+                    self.hass,
+                    self._async_probe_late(data),
+                    f"{entry.title} capabilities",
+                )
+            return
+        firmware = firmware_version(data)
+        if firmware is not None and firmware != self.firmware:
+            _LOGGER.info(
+                "Boiler firmware changed from %s to %s, reloading",
+                self.firmware,
+                firmware,
+            )
+            self.firmware = firmware
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    async def _async_probe_late(self, data: StoutPlusSnapshot) -> None:
+        """Probe the capabilities that were unknown when the entities were set up.
+
+        Every entity was created then, so the entry is only reloaded when
+        one of them turns out to read a field the firmware lacks.
+        """
+        try:
+            capabilities = await async_get_capabilities(self.hass).async_probe(data)
+        finally:
+            self._probing = False
+        if capabilities is None:
+            return
+        self.firmware = firmware_version(data)
+        self.capabilities = capabilities
+        if any(
+            key not in capabilities.get(endpoint, ())
+            for _, context in self._listeners.values()
+            if context
+            for endpoint, key in context[:1]
+        ):
+            _LOGGER.info(
+                "Boiler firmware %s lacks fields of its entities, reloading",
+                self.firmware,
+            )
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        # A pending save writes the data as of its delay, so it is not
+        # postponed by further changes.
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._stored_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _stored_data(self) -> dict[str, Any]:
+        self._save_pending = False
+        return {"raw": {name: self._raw[name] for name in self._available}}
+
+    def _record_cycle(self, started: float, read: list[str], failed: int) -> None:
+        self.cycle_duration = time.monotonic() - started
+        self.cycles.append((time.time(), self.cycle_duration, tuple(read), failed))
+
+    def _activity_interval(self, data: StoutPlusSnapshot) -> timedelta:
+        """Return the poll interval that suits what the boiler is doing.
+
+        The boiler is busy while it heats, runs the anti-legionella cycle or
+        was written to recently. It idles in antifreeze mode, or when its
+        carrier temperature held steady since the previous update.
+        """
+        temperature = data.field("main", "ActValTempCarrier").number
+        previous, self._carrier_temperature = self._carrier_temperature, temperature
+
+        power = data.field("other", "CurrPwr_str").number
+        if (
+            (power is not None and power > 0)
+            or data.field("other", "Antil_stat_str").flag is FieldFlag.ACTIVE
+            or time.monotonic() - self._last_write < WRITE_ACTIVITY_HOLD.total_seconds()
+        ):
+            return self._fast_interval
+        if data.field("main", "setMode").integer == ANTIFREEZE_MODE or (
+            temperature is not None
+            and previous is not None
+            and abs(temperature - previous) < STEADY_TEMPERATURE_DELTA
+        ):
+            return self._slow_interval
+        return self._fast_interval
+
+    @callback
+    def _async_set_poll_interval(self, interval: timedelta) -> None:
+        if interval == self.poll_interval:
+            return
+        previous, self.poll_interval = self.poll_interval, interval
+        if interval < previous:
+            # Do not wait out the deadline set for the slower interval.
+            self._next_update["main"] = min(
+                self._next_update["main"], self._read_from(time.monotonic(), interval)
+            )
+        self.scheduler.async_reschedule(self)
+
+    def _read_from(self, now: float, interval: timedelta) -> float:
+        """Return when an endpoint read at ``now`` is due again.
+
+        Scheduled updates do not fire exactly on time; an endpoint whose
+        deadline falls within a cycle is read in it rather than a whole
+        cycle late. The cycle is the poll interval the deadline is set with,
+        so a later change of the interval does not move the deadline.
+        """
+        return now + interval.total_seconds() - self.poll_interval.total_seconds() / 2
+
+    def _build_snapshot(self) -> StoutPlusSnapshot:
+        """Return the polled data with the optimistic values applied."""
+        raw = self._raw
+        if self._optimistic:
+            raw = dict(raw)
+            for endpoint, values in self._optimistic.items():
+                raw[endpoint] = {**raw[endpoint], **values}
+
+        previous = self.data
+        # The API returns the same payload object for an unchanged body, so on
+        # a quiet cycle this comparison only checks identities per endpoint.
+        if (
+            previous is not None
+            and raw == previous.raw
+            and self._available == previous.available
+            and self._stale == previous.stale
+        ):
+            return previous
+        return StoutPlusSnapshot(
+            dict(raw), frozenset(self._available), previous, stale=self._stale
+        )
+
+    @callback
+    def _async_publish(self) -> None:
+        # Unlike async_set_updated_data this keeps pending refresh requests
+        # and the polling schedule untouched.
+        data = self._build_snapshot()
+        if data is not self.data:
+            self.data = data
+            self.async_update_listeners()
+
+    @property
+    def poll_lag(self) -> float | None:
+        """Return how many seconds the latest scheduled cycle ran late."""
+        return self.scheduler.lag(self.config_entry.entry_id)
+
+    def breaker_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Return the circuit breaker state of every endpoint."""
+        now = time.monotonic()
+        return {name: breaker.as_dict(now) for name, breaker in self._breakers.items()}
+
+    def freshness_diagnostics(self) -> dict[str, dict[str, Any]]:
+        """Return when every endpoint was last read and how old its data is."""
+        now = time.monotonic()
+        return {
+            name: {
+                "last_read": self._last_read[name],
+                "age": (
+                    None
+                    if math.isinf(self._last_success[name])
+                    else now - self._last_success[name]
+                ),
+                "failing": bool(self._breakers[name].failures),
+            }
+            for name in ENDPOINTS
+        }
+
+    def read_error(self, endpoint: str, since: float) -> StoutPlusApiError | None:
+        """Return why an endpoint was not read since the monotonic ``since``.
+
+        Return None when it was read successfully since then.
+        """
+        if self._last_success[endpoint] >= since:
+            return None
+        if (error := self._read_errors.get(endpoint)) is not None:
+            return error
+        return StoutPlusApiError(f"{endpoint} is backing off")
+
     def endpoint_available(self, endpoint: str) -> bool:
-        """Return whether an endpoint succeeded in the latest update."""
-        return endpoint in self.data.get("_available", set())
+        """Return whether an endpoint has data that is not past its grace period."""
+        return endpoint in self.data.available
@@ -0,0 +1,73 @@
+"""Diagnostics support for Stout Plus."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, ENDPOINTS
+from .coordinator import StoutPlusCoordinator
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
+    diagnostics = {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "polling": {
+            "interval": coordinator.poll_interval.total_seconds(),
+            "suppressed_writes": coordinator.suppressed_writes,
+            "cycles": [
+                {
+                    "started": started,
+                    "duration": duration,
+                    "read": list(read),
+                    "failed": failed,
+                }
+                for started, duration, read, failed in coordinator.cycles
+            ],
+        },
+        "scheduler": coordinator.scheduler.diagnostics(entry.entry_id),
+        "connection": coordinator.api.connection_diagnostics(),
+        "firmware": {
+            "version": coordinator.firmware,
+            "capabilities": (
+                None
+                if coordinator.capabilities is None
+                else {
+                    endpoint: sorted(keys)
+                    for endpoint, keys in coordinator.capabilities.items()
+                }
+            ),
+        },
+        "breakers": coordinator.breaker_diagnostics(),
+        "freshness": coordinator.freshness_diagnostics(),
+        "endpoints": {
+            name: coordinator.api.metrics(endpoint).as_dict()
+            for name, endpoint in ENDPOINTS.items()
+        },
+    }
+    # Request errors quote the boiler URL.
+    return _redact_host(diagnostics, coordinator.api.host)
+
+
+def _redact_host(value: Any, host: str) -> Any:
+    """Replace the boiler host in every string of ``value``."""
+    if isinstance(value, str):
+        return value.replace(host, REDACTED)
+    if isinstance(value, dict):
+        return {key: _redact_host(item, host) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_redact_host(item, host) for item in value]
+    return value
@@ -0,0 +1,97 @@
+"""Discovery of Stout Plus boilers on networks without mDNS."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Collection, Mapping
+from ipaddress import IPv4Network, IPv6Network
+from typing import Any
+
+from aiohttp import ClientSession
+from homeassistant.core import HomeAssistant, callback
+
+from .api import StoutPlusApi, StoutPlusApiError
+from .const import (
+    DATA_PROBES,
+    DOMAIN,
+    PROBE_FAILURE_TTL,
+    PROBE_TTL,
+    SCAN_CONCURRENCY,
+    SCAN_TIMEOUT,
+)
+
+# main_params keys that only a Stout Plus boiler reports together.
+BOILER_SIGNATURE = frozenset(
+    {"FullPwr_str", "PowerLevels_str", "SetTempCarrier", "setMode"}
+)
+
+
+def is_boiler(payload: Mapping[str, Any]) -> bool:
+    """Return whether a ``main_params`` payload comes from a boiler."""
+    return BOILER_SIGNATURE <= payload.keys()
+
+
+async def async_scan_network(
+    session: ClientSession,
+    network: IPv4Network | IPv6Network,
+    exclude: Collection[str] = (),
+) -> list[str]:
+    """Return the addresses in ``network`` that answer like a boiler.
+
+    At most ``SCAN_CONCURRENCY`` hosts are probed at once, each with a
+    short timeout, so a range of silent addresses is scanned quickly.
+    """
+    slots = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def probe(host: str) -> bool:
+        async with slots:
+            api = StoutPlusApi(session, host, SCAN_TIMEOUT)
+            try:
+                return is_boiler(await api.async_get("main_params"))
+            except StoutPlusApiError:
+                return False
+
+    hosts = [
+        host for address in network.hosts() if (host := str(address)) not in exclude
+    ]
+    found = await asyncio.gather(*(probe(host) for host in hosts))
+    return [host for host, boiler in zip(hosts, found, strict=True) if boiler]
+
+
+@callback
+def async_get_probe_cache(hass: HomeAssistant) -> ProbeCache:
+    """Return the probe results shared by every discovery flow."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (probes := data.get(DATA_PROBES)) is None:
+        probes = data[DATA_PROBES] = ProbeCache()
+    return probes
+
+
+class ProbeCache:
+    """Recent results of probing announced boilers, by host and name.
+
+    Boilers re-announce themselves often; within the TTL an announcement
+    is answered from here instead of by another request to the boiler.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # (host, name) -> monotonic expiry time and whether the boiler answered.
+        self._results: dict[tuple[str, str], tuple[float, bool]] = {}
+
+    def get(self, host: str, name: str) -> bool | None:
+        """Return the cached result of a probe, or None when it expired."""
+        result = self._results.get((host, name))
+        if result is None or result[0] <= time.monotonic():
+            return None
+        return result[1]
+
+    def set(self, host: str, name: str, reachable: bool) -> None:
+        """Remember the result of a probe and drop the expired ones."""
+        now = time.monotonic()
+        self._results = {
+            key: result for key, result in self._results.items() if result[0] > now
+        }
+        ttl = PROBE_TTL if reachable else PROBE_FAILURE_TTL
+        self._results[(host, name)] = (now + ttl, reachable)
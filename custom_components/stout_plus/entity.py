@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from typing import Any, TypeVar
 
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -10,28 +12,36 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
 
+_EntityT = TypeVar("_EntityT", bound="StoutPlusEntity")
+
+
+def supported_entities(entities: Iterable[_EntityT]) -> list[_EntityT]:
+    """Drop the entities whose main source field the boiler's firmware lacks."""
+    return [
+        entity
+        for entity in entities
+        if not entity.source_keys or entity.coordinator.supports(*entity.source_keys[0])
+    ]
+
 
 class StoutPlusEntity(CoordinatorEntity[StoutPlusCoordinator]):
     """Base class for entities belonging to one boiler."""
 
     _attr_has_entity_name = True
     _endpoint: str | None = None
+    _source_keys: tuple[tuple[str, str], ...] = ()
 
     def __init__(self, coordinator: StoutPlusCoordinator, entry_id: str) -> None:
         """Initialize a boiler entity."""
         super().__init__(coordinator)
         self._entry_id = entry_id
-        full_power = coordinator.data.get("main", {}).get("FullPwr_str")
+        full_power = coordinator.data.field("main", "FullPwr_str").number
         model = "Stout Plus"
-        try:
-            model = f"Stout Plus {float(full_power):g} kW"
-        except (TypeError, ValueError):
-            pass
+        if full_power is not None:
+            model = f"Stout Plus {full_power:g} kW"
 
-        firmware = coordinator.data.get("additional", {}).get(
-            "boilerControllerSoft", ""
-        )
-        firmware_match = re.search(r"\d+(?:\.\d+)+", str(firmware))
+        firmware = coordinator.data.field("additional", "boilerControllerSoft").text
+        firmware_match = re.search(r"\d+(?:\.\d+)+", firmware or "")
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry_id)},
             name="Stout Plus boiler",
@@ -41,6 +51,21 @@ class StoutPlusEntity(CoordinatorEntity[StoutPlusCoordinator]):
             configuration_url=f"http://{coordinator.api.host}",
         )
 
+    @property
+    def source_keys(self) -> tuple[tuple[str, str], ...]:
+        """Return the ``(endpoint, key)`` fields the entity is computed from."""
+        return self._source_keys
+
+    async def async_added_to_hass(self) -> None:
+        """Only listen for updates of the entity's source fields."""
+        self.coordinator_context = self._source_keys or None
+        await super().async_added_to_hass()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag a state restored from before a restart until the boiler answers."""
+        return {"stale": True} if self.coordinator.data.stale else None
+
     @property
     def available(self) -> bool:
         """Return availability of the entity's source endpoint."""
@@ -0,0 +1,103 @@
+"""In-memory history of the numeric boiler fields."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable
+from itertools import accumulate
+from typing import Any
+
+from .const import HISTORY_FIELDS, HISTORY_SAMPLES
+from .snapshot import StoutPlusSnapshot
+
+
+class StoutPlusHistory:
+    """Fixed-size ring buffer of the ``HISTORY_FIELDS`` of every update.
+
+    Samples are stored row by row as float32 values in one preallocated
+    array, with missing values as NaN. Sample times are kept as deltas in
+    milliseconds to the previous sample, so recording a sample allocates
+    nothing and a whole day of samples of one boiler fits in a few hundred
+    kilobytes.
+    """
+
+    __slots__ = ("_count", "_deltas", "_index", "_last", "_start", "_values")
+
+    def __init__(self, capacity: int = HISTORY_SAMPLES) -> None:
+        """Initialize an empty history."""
+        self._values = array("f", bytes(4 * capacity * len(HISTORY_FIELDS)))
+        self._deltas = array("I", bytes(4 * capacity))
+        self._index = 0
+        self._count = 0
+        # Wall clock times of the oldest and the latest sample.
+        self._start = 0.0
+        self._last = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def record(self, timestamp: float, data: StoutPlusSnapshot) -> None:
+        """Append the fields of a snapshot taken at ``timestamp``."""
+        capacity = len(self._deltas)
+        if self._count == capacity:
+            # Overwrite the oldest sample; the next one becomes the oldest.
+            self._start += self._deltas[(self._index + 1) % capacity] / 1000
+        elif not self._count:
+            self._start = self._last = timestamp
+        self._deltas[self._index] = max(round((timestamp - self._last) * 1000), 0)
+        self._last = timestamp
+
+        row = self._index * len(HISTORY_FIELDS)
+        for column, (endpoint, key) in enumerate(HISTORY_FIELDS.values()):
+            number = data.field(endpoint, key).number
+            self._values[row + column] = math.nan if number is None else number
+        self._index = (self._index + 1) % capacity
+        if self._count < capacity:
+            self._count += 1
+
+    def window(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return the samples taken between ``start`` and ``end``.
+
+        Times are Unix timestamps in seconds; fields default to all of
+        ``HISTORY_FIELDS``. Missing values are returned as None.
+        """
+        names = list(HISTORY_FIELDS)
+        columns = [names.index(name) for name in (fields or names)]
+        capacity = len(self._deltas)
+        first = (self._index - self._count) % capacity
+        rows = [(first + offset) % capacity for offset in range(self._count)]
+
+        timestamps: list[float] = []
+        selected: list[int] = []
+        # The delta of the oldest sample points before the window.
+        deltas = (self._deltas[row] for row in rows[1:])
+        for row, time_ms in zip(
+            rows, accumulate(deltas, initial=round(self._start * 1000)), strict=True
+        ):
+            timestamp = time_ms / 1000
+            if (start is None or timestamp >= start) and (
+                end is None or timestamp <= end
+            ):
+                timestamps.append(timestamp)
+                selected.append(row)
+
+        width = len(HISTORY_FIELDS)
+        return {
+            "timestamps": timestamps,
+            "fields": {
+                names[column]: [
+                    None if math.isnan(value) else round(value, 3)
+                    for value in (
+                        self._values[row * width + column] for row in selected
+                    )
+                ]
+                for column in columns
+            },
+        }
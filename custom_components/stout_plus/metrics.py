@@ -0,0 +1,145 @@
+"""Request metrics of the Stout Plus API client."""
+
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Any
+
+from .const import DIAGNOSTICS_RESPONSES, METRICS_WINDOW
+
+# Bytes of an unparsable body kept for diagnostics.
+_BODY_SAMPLE = 500
+
+
+class EndpointMetrics:
+    """Latency, size and outcome statistics of requests to one endpoint.
+
+    Latencies of the latest ``METRICS_WINDOW`` requests, and the latest
+    bodies with the time they were received, are kept in preallocated ring
+    buffers, so recording a request creates no containers. The bodies are
+    only referenced and decoded for diagnostics. Bodies that could not be
+    parsed are counted by the kind of error: invalid character encoding,
+    invalid JSON, or JSON that is not an object.
+    """
+
+    __slots__ = (
+        "_bodies",
+        "_count",
+        "_index",
+        "_latencies",
+        "_received",
+        "_response_count",
+        "_response_index",
+        "bytes_received",
+        "failures",
+        "last_error",
+        "last_unparsable_body",
+        "parse_failures",
+        "successes",
+    )
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialize empty statistics."""
+        self._latencies = array("d", bytes(8 * window))
+        self._index = 0
+        self._count = 0
+        self.bytes_received = 0
+        self.successes = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self.parse_failures: dict[str, int] = {}
+        self.last_unparsable_body: bytes | None = None
+        self._bodies: list[bytes] = [b""] * DIAGNOSTICS_RESPONSES
+        self._received = array("d", bytes(8 * DIAGNOSTICS_RESPONSES))
+        self._response_index = 0
+        self._response_count = 0
+
+    def record_success(self, latency: float, body: bytes) -> None:
+        """Record a successful request and its body."""
+        self._record_latency(latency)
+        self.successes += 1
+        self.bytes_received += len(body)
+        index = self._response_index
+        self._bodies[index] = body
+        self._received[index] = time.time()
+        self._response_index = (index + 1) % DIAGNOSTICS_RESPONSES
+        if self._response_count < DIAGNOSTICS_RESPONSES:
+            self._response_count += 1
+
+    def record_failure(self, latency: float, reason: str) -> None:
+        """Record a failed request."""
+        self._record_latency(latency)
+        self.failures += 1
+        self.last_error = reason
+
+    def record_parse_failure(
+        self, latency: float, reason: str, kind: str, body: bytes
+    ) -> None:
+        """Record a request whose body could not be parsed."""
+        self.record_failure(latency, reason)
+        self.parse_failures[kind] = self.parse_failures.get(kind, 0) + 1
+        self.last_unparsable_body = body[:_BODY_SAMPLE]
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return a latency percentile in seconds over the window."""
+        if not self._count:
+            return None
+        latencies = sorted(self._latencies[: self._count])
+        rank = max(round(fraction * self._count) - 1, 0)
+        return latencies[rank]
+
+    @property
+    def max_latency(self) -> float | None:
+        """Return the highest latency in seconds over the window."""
+        return max(self._latencies[: self._count]) if self._count else None
+
+    def latencies(self) -> list[float]:
+        """Return the latencies in the window, oldest first."""
+        window = len(self._latencies)
+        if self._count < window:
+            return self._latencies[: self._count].tolist()
+        return (
+            self._latencies[self._index :] + self._latencies[: self._index]
+        ).tolist()
+
+    def responses(self) -> list[tuple[float, bytes]]:
+        """Return the latest bodies with their receive times, oldest first."""
+        count = self._response_count
+        start = (self._response_index - count) % DIAGNOSTICS_RESPONSES
+        return [
+            (self._received[index], self._bodies[index])
+            for index in (
+                (start + offset) % DIAGNOSTICS_RESPONSES for offset in range(count)
+            )
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "latency_p50": self.percentile(0.5),
+            "latency_p95": self.percentile(0.95),
+            "latency_max": self.max_latency,
+            "latencies": self.latencies(),
+            "bytes_received": self.bytes_received,
+            "successes": self.successes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "parse_failures": dict(self.parse_failures),
+            "last_unparsable_body": (
+                None
+                if self.last_unparsable_body is None
+                else self.last_unparsable_body.decode(errors="replace")
+            ),
+            "responses": [
+                {"received": received, "body": body.decode(errors="replace")}
+                for received, body in self.responses()
+            ],
+        }
+
+    def _record_latency(self, latency: float) -> None:
+        window = len(self._latencies)
+        self._latencies[self._index] = latency
+        self._index = (self._index + 1) % window
+        if self._count < window:
+            self._count += 1
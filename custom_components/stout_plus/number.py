@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -17,7 +15,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .api import StoutPlusApiError
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -67,8 +65,10 @@ async def async_setup_entry(
     """Set up number entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        StoutPlusNumber(coordinator, entry.entry_id, description)
-        for description in NUMBERS
+        supported_entities(
+            StoutPlusNumber(coordinator, entry.entry_id, description)
+            for description in NUMBERS
+        )
     )
 
 
@@ -86,23 +86,24 @@ class StoutPlusNumber(StoutPlusEntity, NumberEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._endpoint = description.endpoint
+        self._source_keys = ((description.endpoint, description.source_key),)
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
 
     @property
     def native_value(self) -> float | None:
-        raw_value: Any = self.coordinator.data[self.entity_description.endpoint].get(
-            self.entity_description.source_key
-        )
-        match = re.search(r"-?\d+(?:[.,]\d+)?", str(raw_value or ""))
-        return float(match.group(0).replace(",", ".")) if match else None
+        return self.coordinator.data.field(
+            self.entity_description.endpoint, self.entity_description.source_key
+        ).number
 
     async def async_set_native_value(self, value: float) -> None:
+        description = self.entity_description
         try:
-            await self.coordinator.api.async_post_text(
-                self.entity_description.command, f"[{value:.1f}]"
+            await self.coordinator.writer.async_send_text(
+                description.command,
+                f"[{value:.1f}]",
+                {(description.endpoint, description.source_key): f"{value:.1f}"},
             )
         except StoutPlusApiError as err:
             raise HomeAssistantError(
                 "Could not set the Stout Plus numeric value"
             ) from err
-        await self.coordinator.async_request_refresh()
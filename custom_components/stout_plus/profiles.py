@@ -0,0 +1,188 @@
+"""Boiler setups saved by name and applied with as few writes as possible."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_PROFILES, DOMAIN, PROFILES_STORAGE_VERSION
+from .select import FORM_SELECTS
+from .snapshot import StoutPlusSnapshot
+from .writer import BatchCommand
+
+_FORM_VALUES = {
+    description.source_key: description.payload_values for description in FORM_SELECTS
+}
+
+
+def _index(raw: str) -> str:
+    return f"[{int(raw)}]"
+
+
+def _decimal(raw: str) -> str:
+    return f"[{float(raw):.1f}]"
+
+
+def _power(raw: str) -> str:
+    # The form takes kW, the boiler reports active 1.5 kW stages.
+    return f"{int(raw) * 1.5:.1f}"
+
+
+def _form_value(key: str) -> Callable[[str], str]:
+    return lambda raw: _FORM_VALUES[key][int(raw)]
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileField:
+    """A setting kept in profiles and the command that writes it back."""
+
+    endpoint: str
+    key: str
+    command: str
+    # Turns the reported raw value into the text payload or form value.
+    payload: Callable[[str], str] = str
+    form: bool = False
+
+    def is_current(self, data: StoutPlusSnapshot, value: str) -> bool:
+        """Return whether the boiler reports ``value`` for the setting."""
+        return data.field(self.endpoint, self.key).matches(value)
+
+
+PROFILE_FIELDS: dict[str, ProfileField] = {
+    "operating_mode": ProfileField("main", "setMode", "switch_mode", _index),
+    "outdoor_curve": ProfileField("main", "SetDepNumber", "change_outtrg", _index),
+    "power_day": ProfileField(
+        "other", "amountActiveLevelsPerDay", "apply_power_day", _power, form=True
+    ),
+    "power_night": ProfileField(
+        "other", "amountActiveLevelsAtNight", "apply_power_day", _power, form=True
+    ),
+    "day_time": ProfileField("other", "dayTime", "apply_power_day", form=True),
+    "night_time": ProfileField("other", "nightTime", "apply_power_day", form=True),
+    "dhw_target_temperature": ProfileField(
+        "main", "settedTemperatureOfDHW", "change_dhwtrg", _decimal
+    ),
+    "temperature_hysteresis_setting": ProfileField(
+        "other", "gist", "change_gist", _decimal
+    ),
+    "anti_legionella": ProfileField(
+        "other",
+        "Antil_trn",
+        "apply_alig_page",
+        lambda raw: "Включен" if int(raw) else "Выключен",
+        form=True,
+    ),
+    "anti_legionella_temperature": ProfileField(
+        "other", "Antil_temp", "apply_alig_page", _form_value("Antil_temp"), form=True
+    ),
+    "anti_legionella_weekday": ProfileField(
+        "other",
+        "Antil_wday_str",
+        "apply_alig_page",
+        _form_value("Antil_wday_str"),
+        form=True,
+    ),
+    "anti_legionella_time": ProfileField(
+        "other", "set_time_legionella", "apply_alig_page", form=True
+    ),
+}
+
+
+def profile_values(
+    data: StoutPlusSnapshot, names: Iterable[str] | None = None
+) -> dict[str, str]:
+    """Return the reported values of the profile settings, by name.
+
+    Settings the boiler does not report, or reports in a form that could
+    not be written back, are left out.
+    """
+    values: dict[str, str] = {}
+    for name in names or PROFILE_FIELDS:
+        field = PROFILE_FIELDS[name]
+        reported = data.field(field.endpoint, field.key)
+        if reported.text is None:
+            continue
+        try:
+            field.payload(value := str(reported.raw))
+        except (IndexError, ValueError):
+            continue
+        values[name] = value
+    return values
+
+
+def profile_commands(
+    data: StoutPlusSnapshot, profile: Mapping[str, str]
+) -> tuple[list[str], list[BatchCommand]]:
+    """Return the differing settings of a profile and the commands writing them.
+
+    Settings written by the same form are sent together in one command.
+    Raise ValueError when a stored value cannot be written.
+    """
+    changed: list[str] = []
+    commands: list[BatchCommand] = []
+    forms: dict[str, tuple[dict[str, str], dict[tuple[str, str], str]]] = {}
+    for name, value in profile.items():
+        field = PROFILE_FIELDS[name]
+        if field.is_current(data, value):
+            continue
+        try:
+            payload = field.payload(value)
+        except (IndexError, ValueError) as err:
+            raise ValueError(f"Invalid value {value!r} of {name}") from err
+        changed.append(name)
+        updates = {(field.endpoint, field.key): value}
+        if not field.form:
+            commands.append((field.command, payload, updates))
+            continue
+        form, form_updates = forms.setdefault(field.command, ({}, {}))
+        form[field.key] = payload
+        form_updates.update(updates)
+    commands.extend(
+        (command, form, updates) for command, (form, updates) in forms.items()
+    )
+    return changed, commands
+
+
+@callback
+def async_get_profiles(hass: HomeAssistant) -> StoutPlusProfiles:
+    """Return the profiles shared by every config entry."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (profiles := data.get(DATA_PROFILES)) is None:
+        profiles = data[DATA_PROFILES] = StoutPlusProfiles(hass)
+    return profiles
+
+
+class StoutPlusProfiles:
+    """Named boiler setups, e.g. for summer and winter.
+
+    Profiles are not tied to a boiler: one saved from a boiler can be
+    applied to another.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiles."""
+        self._store: Store[dict[str, dict[str, str]]] = Store(
+            hass, PROFILES_STORAGE_VERSION, f"{DOMAIN}.profiles"
+        )
+        self._load_lock = asyncio.Lock()
+        self._profiles: dict[str, dict[str, str]] | None = None
+
+    async def async_get(self, name: str) -> dict[str, str] | None:
+        """Return the values of a profile, or None when it is unknown."""
+        return (await self._async_load()).get(name)
+
+    async def async_save(self, name: str, values: Mapping[str, str]) -> None:
+        """Store a profile, replacing the one of the same name."""
+        profiles = await self._async_load()
+        profiles[name] = dict(values)
+        await self._store.async_save(profiles)
+
+    async def _async_load(self) -> dict[str, dict[str, str]]:
+        async with self._load_lock:
+            if self._profiles is None:
+                self._profiles = await self._store.async_load() or {}
+        return self._profiles
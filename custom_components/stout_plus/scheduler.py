@@ -0,0 +1,194 @@
+"""Poll scheduler shared by all Stout Plus boilers."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    MAX_REQUESTS_IN_FLIGHT,
+    MAX_REQUESTS_PER_HOST,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import StoutPlusCoordinator
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> StoutPlusScheduler:
+    """Return the scheduler shared by every config entry."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := data.get(DATA_SCHEDULER)) is None:
+        scheduler = data[DATA_SCHEDULER] = StoutPlusScheduler(hass)
+    return scheduler
+
+
+class _ScheduledEntry:
+    """Polling state of one registered coordinator."""
+
+    __slots__ = ("coordinator", "due", "fired", "handle", "lag", "slot", "task")
+
+    def __init__(self, coordinator: StoutPlusCoordinator, slot: int) -> None:
+        self.coordinator = coordinator
+        self.slot = slot
+        self.due = 0.0
+        self.fired = 0.0
+        self.handle: asyncio.TimerHandle | None = None
+        self.lag: float | None = None
+        self.task: asyncio.Task[None] | None = None
+
+
+class StoutPlusScheduler:
+    """Poll every boiler on its own phase with bounded concurrency.
+
+    Each coordinator gets a slot whose phase offsets its cycles within the
+    poll interval, so boilers sharing an interval do not all fire at the
+    same instant. Every request waits for a per-host and a global slot.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_in_flight: int = MAX_REQUESTS_IN_FLIGHT,
+        max_per_host: int = MAX_REQUESTS_PER_HOST,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._max_in_flight = max_in_flight
+        self._max_per_host = max_per_host
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._entries: dict[str, _ScheduledEntry] = {}
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @asynccontextmanager
+    async def async_request_slot(self, host: str) -> AsyncIterator[None]:
+        """Wait until a request to ``host`` may be sent."""
+        host_slots = self._hosts.get(host)
+        if host_slots is None:
+            host_slots = self._hosts[host] = asyncio.Semaphore(self._max_per_host)
+        # Take the host slot first, so a busy boiler does not hold global ones.
+        async with host_slots, self._in_flight:
+            yield
+
+    @callback
+    def async_register(
+        self, coordinator: StoutPlusCoordinator, *, immediate: bool = False
+    ) -> None:
+        """Start polling a coordinator on a free phase.
+
+        With ``immediate`` the first cycle starts right away rather than at
+        the coordinator's phase.
+        """
+        used = {entry.slot for entry in self._entries.values()}
+        slot = next(index for index in itertools.count() if index not in used)
+        entry = _ScheduledEntry(coordinator, slot)
+        self._entries[coordinator.config_entry.entry_id] = entry
+        if immediate:
+            self._async_start(entry, self._hass.loop.time())
+        self._async_schedule(entry)
+
+    @callback
+    def async_unregister(self, coordinator: StoutPlusCoordinator) -> None:
+        """Stop polling a coordinator."""
+        entry = self._entries.pop(coordinator.config_entry.entry_id, None)
+        if entry is not None and entry.handle is not None:
+            entry.handle.cancel()
+
+    @callback
+    def async_reschedule(self, coordinator: StoutPlusCoordinator) -> None:
+        """Move the next cycle of a coordinator after its interval changed."""
+        entry = self._entries.get(coordinator.config_entry.entry_id)
+        if entry is not None and entry.handle is not None:
+            entry.handle.cancel()
+            self._async_schedule(entry)
+
+    def lag(self, entry_id: str) -> float | None:
+        """Return how late the latest scheduled cycle of an entry completed."""
+        entry = self._entries.get(entry_id)
+        return None if entry is None else entry.lag
+
+    def diagnostics(self, entry_id: str) -> dict[str, Any]:
+        """Return the scheduling state of an entry for diagnostics."""
+        result: dict[str, Any] = {
+            "entries": len(self._entries),
+            "max_requests_in_flight": self._max_in_flight,
+            "max_requests_per_host": self._max_per_host,
+        }
+        if (entry := self._entries.get(entry_id)) is not None:
+            result.update(
+                slot=entry.slot,
+                phase=_phase(entry.slot),
+                next_cycle_in=max(entry.due - self._hass.loop.time(), 0.0),
+                lag=entry.lag,
+                cycle_running=entry.task is not None and not entry.task.done(),
+            )
+        return result
+
+    @callback
+    def _async_schedule(self, entry: _ScheduledEntry) -> None:
+        """Schedule the next cycle at the entry's phase of its interval."""
+        interval = entry.coordinator.poll_interval.total_seconds()
+        now = self._hass.loop.time()
+        due = (math.floor(now / interval) + _phase(entry.slot)) * interval
+        # Timers may fire marginally early; never run the same cycle twice.
+        while due <= max(now, entry.fired):
+            due += interval
+        entry.due = due
+        entry.handle = self._hass.loop.call_at(due, self._async_poll, entry)
+
+    @callback
+    def _async_poll(self, entry: _ScheduledEntry) -> None:
+        due = entry.fired = entry.due
+        self._async_schedule(entry)
+        if entry.task is not None and not entry.task.done():
+            # The previous cycle is still waiting for the boiler.
+            return
+        self._async_start(entry, due)
+
+    @callback
+    def _async_start(self, entry: _ScheduledEntry, due: float) -> None:
+        config_entry = entry.coordinator.config_entry
+        entry.task = config_entry.async_create_background_task(
+            self._hass,
+            self._async_refresh(entry, due),
+            f"{config_entry.title} poll",
+        )
+
+    async def _async_refresh(self, entry: _ScheduledEntry, due: float) -> None:
+        await entry.coordinator.async_refresh()
+        entry.lag = max(self._hass.loop.time() - due, 0.0)
+        # The lag sensors do not depend on the data, so tell them separately.
+        entry.coordinator.async_update_listeners()
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        for entry in self._entries.values():
+            if entry.handle is not None:
+                entry.handle.cancel()
+        self._entries.clear()
+
+
+def _phase(slot: int) -> float:
+    """Return the offset of a slot as a fraction of the poll interval.
+
+    The van der Corput sequence (0, 1/2, 1/4, 3/4, ...) keeps the phases
+    evenly spread however many boilers are registered, without moving the
+    phases already handed out.
+    """
+    phase, base = 0.0, 0.5
+    while slot:
+        if slot & 1:
+            phase += base
+        slot >>= 1
+        base /= 2
+    return phase
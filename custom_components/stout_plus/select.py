@@ -14,7 +14,8 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .api import StoutPlusApiError
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
+from .snapshot import StoutPlusSnapshot
 
 POWER_OPTIONS = ["1.5", "3.0", "4.5", "6.0", "7.5", "9.0"]
 
@@ -189,21 +190,23 @@ async def async_setup_entry(
     """Set up select entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        [
-            *(
-                StoutPlusPowerSelect(coordinator, entry.entry_id, description)
-                for description in SELECTS
-            ),
-            *(
-                StoutPlusIndexSelect(coordinator, entry.entry_id, description)
-                for description in INDEX_SELECTS
-            ),
-            *(
-                StoutPlusFormSelect(coordinator, entry.entry_id, description)
-                for description in FORM_SELECTS
-            ),
-            StoutPlusDhwPowerSelect(coordinator, entry.entry_id),
-        ]
+        supported_entities(
+            [
+                *(
+                    StoutPlusPowerSelect(coordinator, entry.entry_id, description)
+                    for description in SELECTS
+                ),
+                *(
+                    StoutPlusIndexSelect(coordinator, entry.entry_id, description)
+                    for description in INDEX_SELECTS
+                ),
+                *(
+                    StoutPlusFormSelect(coordinator, entry.entry_id, description)
+                    for description in FORM_SELECTS
+                ),
+                StoutPlusDhwPowerSelect(coordinator, entry.entry_id),
+            ]
+        )
     )
 
 
@@ -222,15 +225,15 @@ class StoutPlusPowerSelect(StoutPlusEntity, SelectEntity):
     ) -> None:
         super().__init__(coordinator, entry_id)
         self.entity_description = description
+        self._source_keys = (("other", description.source_key),)
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
 
     @property
     def current_option(self) -> str | None:
-        try:
-            stages = int(
-                self.coordinator.data["other"][self.entity_description.source_key]
-            )
-        except (KeyError, TypeError, ValueError):
+        stages = self.coordinator.data.field(
+            "other", self.entity_description.source_key
+        ).integer
+        if stages is None:
             return None
         option = f"{stages * 1.5:.1f}"
         return option if option in self.options else None
@@ -241,16 +244,17 @@ class StoutPlusPowerSelect(StoutPlusEntity, SelectEntity):
         The boiler accepts kW in the form but reports the resulting number of
         active 1.5 kW stages from ``other_params``.
         """
+        source_key = self.entity_description.source_key
         try:
-            await self.coordinator.api.async_post_form(
+            await self.coordinator.writer.async_send_form(
                 "apply_power_day",
-                {self.entity_description.source_key: option},
+                {source_key: option},
+                {("other", source_key): str(round(float(option) / 1.5))},
             )
         except StoutPlusApiError as err:
             raise HomeAssistantError(
                 "Could not set the Stout Plus power limit"
             ) from err
-        await self.coordinator.async_request_refresh()
 
 
 class StoutPlusIndexSelect(StoutPlusEntity, SelectEntity):
@@ -267,30 +271,31 @@ class StoutPlusIndexSelect(StoutPlusEntity, SelectEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._endpoint = description.endpoint
+        self._source_keys = ((description.endpoint, description.source_key),)
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
         self._attr_options = list(description.options)
 
     @property
     def current_option(self) -> str | None:
+        index = self.coordinator.data.field(
+            self.entity_description.endpoint, self.entity_description.source_key
+        ).integer
         try:
-            index = int(
-                self.coordinator.data[self.entity_description.endpoint][
-                    self.entity_description.source_key
-                ]
-            )
-            return self.options[index]
-        except (IndexError, KeyError, TypeError, ValueError):
+            return None if index is None else self.options[index]
+        except IndexError:
             return None
 
     async def async_select_option(self, option: str) -> None:
+        description = self.entity_description
         try:
             index = self.options.index(option)
-            await self.coordinator.api.async_post_text(
-                self.entity_description.command, f"[{index}]"
+            await self.coordinator.writer.async_send_text(
+                description.command,
+                f"[{index}]",
+                {(description.endpoint, description.source_key): str(index)},
             )
         except (StoutPlusApiError, ValueError) as err:
             raise HomeAssistantError("Could not set the Stout Plus option") from err
-        await self.coordinator.async_request_refresh()
 
 
 class StoutPlusDhwPowerSelect(StoutPlusEntity, SelectEntity):
@@ -300,6 +305,11 @@ class StoutPlusDhwPowerSelect(StoutPlusEntity, SelectEntity):
     _attr_icon = "mdi:water-boiler"
     _endpoint = "main"
     _attr_entity_category = EntityCategory.CONFIG
+    _source_keys = (
+        ("main", "DHWLevel"),
+        ("main", "PowerLevels_str"),
+        ("main", "FullPwr_str"),
+    )
 
     def __init__(self, coordinator: StoutPlusCoordinator, entry_id: str) -> None:
         super().__init__(coordinator, entry_id)
@@ -307,30 +317,26 @@ class StoutPlusDhwPowerSelect(StoutPlusEntity, SelectEntity):
 
     @property
     def options(self) -> list[str]:
-        try:
-            stages = int(self.coordinator.data["main"]["PowerLevels_str"])
-            full_power = float(self.coordinator.data["main"]["FullPwr_str"])
-        except (KeyError, TypeError, ValueError):
-            return []
-        return [f"{full_power / stages * index:.1f}" for index in range(1, stages + 1)]
+        return self.coordinator.data.cached("dhw_power_options", _dhw_power_options)
 
     @property
     def current_option(self) -> str | None:
+        level = self.coordinator.data.field("main", "DHWLevel").integer
         try:
-            level = int(self.coordinator.data["main"]["DHWLevel"])
-            return self.options[level - 1]
-        except (IndexError, KeyError, TypeError, ValueError):
+            return None if level is None else self.options[level - 1]
+        except IndexError:
             return None
 
     async def async_select_option(self, option: str) -> None:
         try:
             index = self.options.index(option)
-            await self.coordinator.api.async_post_text("change_pwrlst", f"[{index}]")
+            await self.coordinator.writer.async_send_text(
+                "change_pwrlst", f"[{index}]", {("main", "DHWLevel"): str(index + 1)}
+            )
         except (StoutPlusApiError, ValueError) as err:
             raise HomeAssistantError(
                 "Could not set the Stout Plus domestic hot water power"
             ) from err
-        await self.coordinator.async_request_refresh()
 
 
 class StoutPlusFormSelect(StoutPlusEntity, SelectEntity):
@@ -347,34 +353,48 @@ class StoutPlusFormSelect(StoutPlusEntity, SelectEntity):
     ) -> None:
         super().__init__(coordinator, entry_id)
         self.entity_description = description
+        self._source_keys = (("other", description.source_key),)
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
         self._attr_options = list(description.options)
 
     @property
     def current_option(self) -> str | None:
+        index = self.coordinator.data.field(
+            "other", self.entity_description.source_key
+        ).integer
+        if index is None:
+            return None
+        if self.entity_description.index_mask is not None:
+            index &= self.entity_description.index_mask
         try:
-            index = int(
-                self.coordinator.data["other"][self.entity_description.source_key]
-            )
-            if self.entity_description.index_mask is not None:
-                index &= self.entity_description.index_mask
             return self.options[index]
-        except (IndexError, KeyError, TypeError, ValueError):
+        except IndexError:
             return None
 
     async def async_select_option(self, option: str) -> None:
+        description = self.entity_description
         try:
             index = self.options.index(option)
-            await self.coordinator.api.async_post_form(
-                self.entity_description.command,
-                {
-                    self.entity_description.source_key: (
-                        self.entity_description.payload_values[index]
-                    )
-                },
+            reported = index
+            current = self.coordinator.data.field("other", description.source_key)
+            if description.index_mask is not None and current.integer is not None:
+                # Keep the bits outside the mask as the boiler reported them.
+                reported |= current.integer & ~description.index_mask
+            await self.coordinator.writer.async_send_form(
+                description.command,
+                {description.source_key: description.payload_values[index]},
+                {("other", description.source_key): str(reported)},
             )
         except (StoutPlusApiError, ValueError) as err:
             raise HomeAssistantError(
                 "Could not set the Stout Plus form option"
             ) from err
-        await self.coordinator.async_request_refresh()
+
+
+def _dhw_power_options(data: StoutPlusSnapshot) -> list[str]:
+    """Return the selectable hot water power steps in kW."""
+    stages = data.field("main", "PowerLevels_str").integer
+    full_power = data.field("main", "FullPwr_str").number
+    if stages is None or full_power is None:
+        return []
+    return [f"{full_power / stages * index:.1f}" for index in range(1, stages + 1)]
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import re
+import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
-from html import unescape
-from typing import Any, Literal
+from datetime import datetime, timedelta
+from typing import Literal
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,14 +16,43 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfPower, UnitOfPressure, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    UnitOfInformation,
+    UnitOfPower,
+    UnitOfPressure,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import (
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PUBLISH_HEARTBEAT,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PUBLISH_HEARTBEAT,
+    DOMAIN,
+    ENDPOINTS,
+)
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
+
+
+@dataclass(frozen=True, kw_only=True)
+class PublishPolicy:
+    """Limit the state writes of a noisy measurement.
+
+    A change smaller than ``deadband`` (in the native unit) is held back
+    until ``heartbeat`` has passed since the previous write; a larger change
+    until ``min_interval`` has. Intervals left unset use the defaults from
+    the integration options.
+    """
+
+    deadband: float = 0.0
+    min_interval: timedelta | None = None
+    heartbeat: timedelta | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -32,6 +63,7 @@ class StoutPlusSensorDescription(SensorEntityDescription):
     source_key: str
     precision: int | None = None
     value_kind: Literal["number", "text"] = "number"
+    publish_policy: PublishPolicy | None = None
 
 
 SENSORS: tuple[StoutPlusSensorDescription, ...] = (
@@ -43,6 +75,7 @@ SENSORS: tuple[StoutPlusSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
+        publish_policy=PublishPolicy(),
     ),
     StoutPlusSensorDescription(
         key="pressure",
@@ -52,6 +85,7 @@ SENSORS: tuple[StoutPlusSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfPressure.BAR,
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
+        publish_policy=PublishPolicy(deadband=0.02),
     ),
     StoutPlusSensorDescription(
         key="room_temp",
@@ -62,6 +96,7 @@ SENSORS: tuple[StoutPlusSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         precision=1,
+        publish_policy=PublishPolicy(deadband=0.2),
     ),
     StoutPlusSensorDescription(
         key="boiler_water_temperature",
@@ -72,6 +107,7 @@ SENSORS: tuple[StoutPlusSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         precision=1,
+        publish_policy=PublishPolicy(deadband=0.2),
     ),
     StoutPlusSensorDescription(
         key="outdoor_temperature",
@@ -82,6 +118,7 @@ SENSORS: tuple[StoutPlusSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         precision=1,
+        publish_policy=PublishPolicy(deadband=0.2),
     ),
     StoutPlusSensorDescription(
         key="dhw_temperature",
@@ -295,6 +332,135 @@ SENSORS: tuple[StoutPlusSensorDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class StoutPlusPollingSensorDescription(SensorEntityDescription):
+    """Describe a sensor reporting how the boiler is polled."""
+
+    value_fn: Callable[[StoutPlusCoordinator], float | str | None]
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else seconds * 1000
+
+
+def _endpoint_metric_sensors(
+    endpoint: str,
+) -> tuple[StoutPlusPollingSensorDescription, ...]:
+    """Describe the request statistics sensors of one endpoint."""
+    common = {
+        "translation_placeholders": {"endpoint": endpoint},
+        "entity_category": EntityCategory.DIAGNOSTIC,
+        "entity_registry_enabled_default": False,
+    }
+    latency = {
+        "native_unit_of_measurement": UnitOfTime.MILLISECONDS,
+        "device_class": SensorDeviceClass.DURATION,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "suggested_display_precision": 0,
+    }
+    return (
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_latency_p50",
+            translation_key="endpoint_latency_p50",
+            value_fn=lambda c: _milliseconds(c.api.metrics(endpoint).percentile(0.5)),
+            **latency,
+            **common,
+        ),
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_latency_p95",
+            translation_key="endpoint_latency_p95",
+            value_fn=lambda c: _milliseconds(c.api.metrics(endpoint).percentile(0.95)),
+            **latency,
+            **common,
+        ),
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_latency_max",
+            translation_key="endpoint_latency_max",
+            value_fn=lambda c: _milliseconds(c.api.metrics(endpoint).max_latency),
+            **latency,
+            **common,
+        ),
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_bytes_received",
+            translation_key="endpoint_bytes_received",
+            value_fn=lambda c: c.api.metrics(endpoint).bytes_received,
+            native_unit_of_measurement=UnitOfInformation.BYTES,
+            device_class=SensorDeviceClass.DATA_SIZE,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            **common,
+        ),
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_successes",
+            translation_key="endpoint_successes",
+            value_fn=lambda c: c.api.metrics(endpoint).successes,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            **common,
+        ),
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_failures",
+            translation_key="endpoint_failures",
+            value_fn=lambda c: c.api.metrics(endpoint).failures,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            **common,
+        ),
+        StoutPlusPollingSensorDescription(
+            key=f"{endpoint}_last_error",
+            translation_key="endpoint_last_error",
+            # States are limited to 255 characters.
+            value_fn=lambda c: (c.api.metrics(endpoint).last_error or "")[:255] or None,
+            **common,
+        ),
+    )
+
+
+POLLING_SENSORS: tuple[StoutPlusPollingSensorDescription, ...] = (
+    StoutPlusPollingSensorDescription(
+        key="poll_lag",
+        translation_key="poll_lag",
+        value_fn=lambda coordinator: coordinator.poll_lag,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    StoutPlusPollingSensorDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        value_fn=lambda coordinator: coordinator.poll_interval.total_seconds(),
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    StoutPlusPollingSensorDescription(
+        key="suppressed_writes",
+        translation_key="suppressed_writes",
+        value_fn=lambda coordinator: coordinator.suppressed_writes,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    StoutPlusPollingSensorDescription(
+        key="cycle_duration",
+        translation_key="cycle_duration",
+        value_fn=lambda coordinator: _milliseconds(coordinator.cycle_duration),
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    ),
+    *(
+        description
+        for endpoint in ENDPOINTS.values()
+        for description in _endpoint_metric_sensors(endpoint)
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -303,8 +469,18 @@ async def async_setup_entry(
     """Set up sensor entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        StoutPlusSensor(coordinator, entry.entry_id, description)
-        for description in SENSORS
+        supported_entities(
+            [
+                *(
+                    StoutPlusSensor(coordinator, entry.entry_id, description)
+                    for description in SENSORS
+                ),
+                *(
+                    StoutPlusPollingSensor(coordinator, entry.entry_id, description)
+                    for description in POLLING_SENSORS
+                ),
+            ]
+        )
     )
 
 
@@ -322,32 +498,121 @@ class StoutPlusSensor(StoutPlusEntity, SensorEntity):
         super().__init__(coordinator, entry_id)
         self.entity_description = description
         self._endpoint = description.endpoint
+        self._source_keys = ((description.endpoint, description.source_key),)
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
+        # Status and value of the latest state write, and its time.
+        self._published_status: tuple[bool, bool] | None = None
+        self._published_value: float | str | None = None
+        self._published_at = 0.0
+        self._unsub_deferred: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the initial state as published."""
+        await super().async_added_to_hass()
+        self._async_set_published()
+        self.async_on_remove(self._async_cancel_deferred)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless the publishing policy holds it back."""
+        if (delay := self._publish_delay()) <= 0:
+            self._async_publish()
+            return
+        self.coordinator.suppressed_writes += 1
+        self._async_cancel_deferred()
+        self._unsub_deferred = async_call_later(
+            self.hass, delay, self._async_publish_deferred
+        )
+
+    def _publish_delay(self) -> float:
+        """Return the seconds the current state is held back for."""
+        policy = self.entity_description.publish_policy
+        value, previous = self.native_value, self._published_value
+        if (
+            policy is None
+            or self._published_status != self._status
+            or not isinstance(value, float)
+            or not isinstance(previous, float)
+        ):
+            return 0.0
+
+        options = self.coordinator.config_entry.options
+        heartbeat = policy.heartbeat or timedelta(
+            seconds=options.get(CONF_PUBLISH_HEARTBEAT, DEFAULT_PUBLISH_HEARTBEAT)
+        )
+        change = abs(value - previous)
+        hold = (
+            heartbeat
+            if change < policy.deadband and not math.isclose(change, policy.deadband)
+            else min(
+                heartbeat,
+                policy.min_interval
+                or timedelta(
+                    seconds=options.get(
+                        CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                    )
+                ),
+            )
+        )
+        return hold.total_seconds() - (time.monotonic() - self._published_at)
+
+    @callback
+    def _async_publish_deferred(self, _now: datetime) -> None:
+        self._unsub_deferred = None
+        self._async_publish()
+
+    @callback
+    def _async_publish(self) -> None:
+        self._async_cancel_deferred()
+        self._async_set_published()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_set_published(self) -> None:
+        self._published_status = self._status
+        self._published_value = self.native_value
+        self._published_at = time.monotonic()
+
+    @property
+    def _status(self) -> tuple[bool, bool]:
+        """Return the availability and staleness written with the state."""
+        return self.available, self.coordinator.data.stale
+
+    @callback
+    def _async_cancel_deferred(self) -> None:
+        if self._unsub_deferred is not None:
+            self._unsub_deferred()
+            self._unsub_deferred = None
 
     @property
     def native_value(self) -> float | str | None:
-        raw_value: Any = self.coordinator.data[self.entity_description.endpoint].get(
-            self.entity_description.source_key
+        field = self.coordinator.data.field(
+            self.entity_description.endpoint, self.entity_description.source_key
         )
-        if raw_value is None:
-            return None
-
         if self.entity_description.value_kind == "text":
-            value = _strip_html(str(raw_value))
-            return value or None
-
-        match = re.search(r"-?\d+(?:[.,]\d+)?", str(raw_value))
-        if match is None:
-            return None
-        try:
-            value = float(match.group(0).replace(",", "."))
-        except ValueError:
-            return None
-        if self.entity_description.precision is not None:
+            return field.text
+
+        value = field.number
+        if value is not None and self.entity_description.precision is not None:
             return round(value, self.entity_description.precision)
         return value
 
 
-def _strip_html(value: str) -> str:
-    """Return readable text from the small HTML fragments used by the API."""
-    return " ".join(unescape(re.sub(r"<[^>]+>", " ", value)).split())
+class StoutPlusPollingSensor(StoutPlusEntity, SensorEntity):
+    """A measurement of the integration's own polling of the boiler."""
+
+    entity_description: StoutPlusPollingSensorDescription
+
+    def __init__(
+        self,
+        coordinator: StoutPlusCoordinator,
+        entry_id: str,
+        description: StoutPlusPollingSensorDescription,
+    ) -> None:
+        super().__init__(coordinator, entry_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
+
+    @property
+    def native_value(self) -> float | None:
+        return self.entity_description.value_fn(self.coordinator)
@@ -0,0 +1,149 @@
+"""Services of the Stout Plus integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import StoutPlusApiError
+from .const import DOMAIN, HISTORY_FIELDS
+from .coordinator import StoutPlusCoordinator, async_get_coordinator
+from .profiles import (
+    PROFILE_FIELDS,
+    async_get_profiles,
+    profile_commands,
+    profile_values,
+)
+
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_SAVE_PROFILE = "save_profile"
+SERVICE_APPLY_PROFILE = "apply_profile"
+
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_FIELDS = "fields"
+ATTR_NAME = "name"
+ATTR_SETTINGS = "settings"
+
+HISTORY_WINDOW_SCHEMA = {
+    vol.Optional(ATTR_START): cv.datetime,
+    vol.Optional(ATTR_END): cv.datetime,
+    vol.Optional(ATTR_FIELDS): vol.All(cv.ensure_list, [vol.In(HISTORY_FIELDS)]),
+}
+GET_HISTORY_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string, **HISTORY_WINDOW_SCHEMA}
+)
+SAVE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_SETTINGS): vol.All(cv.ensure_list, [vol.In(PROFILE_FIELDS)]),
+    }
+)
+APPLY_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_NAME): cv.string,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        _async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_PROFILE,
+        _async_save_profile,
+        schema=SAVE_PROFILE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PROFILE,
+        _async_apply_profile,
+        schema=APPLY_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def history_window(
+    coordinator: StoutPlusCoordinator, data: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Return the history samples selected by validated window arguments."""
+    return coordinator.history.window(
+        _timestamp(data.get(ATTR_START)),
+        _timestamp(data.get(ATTR_END)),
+        data.get(ATTR_FIELDS),
+    )
+
+
+@callback
+def _async_get_history(call: ServiceCall) -> ServiceResponse:
+    """Return recent values of the numeric fields without the recorder."""
+    return history_window(_coordinator(call), call.data)
+
+
+async def _async_save_profile(call: ServiceCall) -> None:
+    """Store the current settings of a boiler under a name."""
+    values = profile_values(_coordinator(call).data, call.data.get(ATTR_SETTINGS))
+    await async_get_profiles(call.hass).async_save(call.data[ATTR_NAME], values)
+
+
+async def _async_apply_profile(call: ServiceCall) -> ServiceResponse:
+    """Write the settings of a profile that differ from the boiler's."""
+    coordinator = _coordinator(call)
+    name = call.data[ATTR_NAME]
+    if (profile := await async_get_profiles(call.hass).async_get(name)) is None:
+        raise ServiceValidationError(f"Unknown Stout Plus profile {name}")
+    # Leave out what the boiler's firmware does not have.
+    supported = {
+        setting: value
+        for setting, value in profile.items()
+        if setting in PROFILE_FIELDS
+        and coordinator.supports(
+            PROFILE_FIELDS[setting].endpoint, PROFILE_FIELDS[setting].key
+        )
+    }
+    try:
+        changed, commands = profile_commands(coordinator.data, supported)
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+    try:
+        await coordinator.writer.async_send_batch(commands)
+    except StoutPlusApiError as err:
+        raise HomeAssistantError(
+            f"Could not apply the Stout Plus profile {name}: {err}"
+        ) from err
+    return {"changed": changed}
+
+
+def _coordinator(call: ServiceCall) -> StoutPlusCoordinator:
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    if (coordinator := async_get_coordinator(call.hass, entry_id)) is None:
+        raise ServiceValidationError(f"Stout Plus entry {entry_id} is not loaded")
+    return coordinator
+
+
+def _timestamp(value: datetime | None) -> float | None:
+    return None if value is None else dt_util.as_utc(value).timestamp()
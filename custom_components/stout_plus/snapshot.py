@@ -0,0 +1,181 @@
+"""Decoded boiler data shared by all Stout Plus entities."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from enum import StrEnum
+from html import unescape
+from typing import Any
+
+_NUMBER_PATTERN = re.compile(r"-?\d+(?:[.,]\d+)?")
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+class FieldFlag(StrEnum):
+    """Status words used by the boiler in its Russian text fields."""
+
+    NO_ERRORS = "no_errors"
+    DISCONNECTED = "disconnected"
+    CONNECTED = "connected"
+    RUNNING = "running"
+    INACTIVE = "inactive"
+    ACTIVE = "active"
+
+
+class StoutPlusField:
+    """One API value decoded into the forms the entities need."""
+
+    __slots__ = ("flag", "integer", "number", "raw", "text")
+
+    def __init__(self, raw: Any) -> None:
+        """Decode a raw API value."""
+        self.raw = raw
+        self.text: str | None = None
+        self.number: float | None = None
+        self.integer: int | None = None
+        self.flag: FieldFlag | None = None
+        if raw is None:
+            return
+
+        value = str(raw)
+        self.text = strip_html(value) or None
+        if match := _NUMBER_PATTERN.search(value):
+            self.number = float(match.group(0).replace(",", "."))
+        try:
+            self.integer = int(raw)
+        except (TypeError, ValueError):
+            pass
+        self.flag = _decode_flag(value)
+
+    def matches(self, raw: Any) -> bool:
+        """Return whether ``raw`` decodes to the same value as this field.
+
+        Plain numbers are compared by value, so "30" matches "30.0"; any
+        other text, such as the time "07:30", must be the same.
+        """
+        other = StoutPlusField(raw)
+        if self.is_plain_number and other.is_plain_number:
+            return self.number == other.number
+        return self.text == other.text
+
+    @property
+    def is_plain_number(self) -> bool:
+        """Return whether the value is a number and nothing else."""
+        return self.text is not None and bool(_NUMBER_PATTERN.fullmatch(self.text))
+
+
+MISSING_FIELD = StoutPlusField(None)
+
+
+class StoutPlusSnapshot:
+    """Every endpoint payload of one update, decoded once.
+
+    Fields whose raw value did not change are shared with the previous
+    snapshot, so an update only decodes what the boiler actually changed.
+    A ``stale`` snapshot holds the data saved by a previous run.
+    """
+
+    __slots__ = ("_cache", "available", "fields", "generation", "raw", "stale")
+
+    def __init__(
+        self,
+        raw: Mapping[str, Mapping[str, Any]],
+        available: frozenset[str],
+        previous: StoutPlusSnapshot | None = None,
+        *,
+        stale: bool = False,
+    ) -> None:
+        """Decode the endpoint payloads of one update."""
+        self.raw = raw
+        self.available = available
+        self.stale = stale
+        self.generation = previous.generation + 1 if previous is not None else 0
+        self.fields: dict[str, dict[str, StoutPlusField]] = {}
+        self._cache: dict[str, Any] = {}
+        previous_fields = previous.fields if previous is not None else {}
+        for endpoint, payload in raw.items():
+            old = previous_fields.get(endpoint, {})
+            if previous is not None and previous.raw.get(endpoint) is payload:
+                # The endpoint was not re-read in this update.
+                self.fields[endpoint] = old
+                continue
+            fields: dict[str, StoutPlusField] = {}
+            for key, value in payload.items():
+                field = old.get(key)
+                fields[key] = (
+                    field
+                    if field is not None and field.raw == value
+                    else StoutPlusField(value)
+                )
+            self.fields[endpoint] = fields
+
+    def field(self, endpoint: str, key: str) -> StoutPlusField:
+        """Return a decoded field, or an empty field when it is missing."""
+        return self.fields.get(endpoint, {}).get(key, MISSING_FIELD)
+
+    def changed_keys(self, previous: StoutPlusSnapshot) -> set[tuple[str, str]]:
+        """Return the ``(endpoint, key)`` pairs that differ from ``previous``."""
+        changed: set[tuple[str, str]] = set()
+        for endpoint in self.fields.keys() | previous.fields.keys():
+            new = self.fields.get(endpoint, {})
+            old = previous.fields.get(endpoint, {})
+            if new is old:
+                continue
+            changed.update(
+                (endpoint, key)
+                for key in new.keys() | old.keys()
+                if new.get(key) is not old.get(key)
+            )
+        return changed
+
+    def as_dict(self, keys: Iterable[tuple[str, str]] | None = None) -> dict[str, Any]:
+        """Return the decoded fields, or only ``keys``, for external clients."""
+        if keys is None:
+            keys = (
+                (endpoint, key)
+                for endpoint, fields in self.fields.items()
+                for key in fields
+            )
+        fields: dict[str, dict[str, dict[str, Any]]] = {}
+        for endpoint, key in keys:
+            field = self.field(endpoint, key)
+            fields.setdefault(endpoint, {})[key] = {
+                "text": field.text,
+                "number": field.number,
+            }
+        return {
+            "available": sorted(self.available),
+            "stale": self.stale,
+            "fields": fields,
+        }
+
+    def cached(self, name: str, factory: Callable[[StoutPlusSnapshot], Any]) -> Any:
+        """Return a derived value computed at most once per snapshot."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = factory(self)
+            return value
+
+
+def strip_html(value: str) -> str:
+    """Return readable text from the small HTML fragments used by the API."""
+    return " ".join(unescape(_TAG_PATTERN.sub(" ", value)).split())
+
+
+def _decode_flag(value: str) -> FieldFlag | None:
+    lowered = value.lower()
+    if "без ошибок" in lowered:
+        return FieldFlag.NO_ERRORS
+    if "Отключен" in value:
+        return FieldFlag.DISCONNECTED
+    if "Подключен" in value:
+        return FieldFlag.CONNECTED
+    if "Работают" in value:
+        return FieldFlag.RUNNING
+    if "не активен" in lowered:
+        return FieldFlag.INACTIVE
+    if "активен" in lowered:
+        return FieldFlag.ACTIVE
+    return None
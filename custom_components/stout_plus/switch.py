@@ -12,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .api import StoutPlusApiError
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
 
 
 async def async_setup_entry(
@@ -23,9 +23,11 @@ async def async_setup_entry(
     """Set up switch entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        (
-            StoutPlusDhwSwitch(coordinator, entry.entry_id),
-            StoutPlusAntiLegionellaSwitch(coordinator, entry.entry_id),
+        supported_entities(
+            (
+                StoutPlusDhwSwitch(coordinator, entry.entry_id),
+                StoutPlusAntiLegionellaSwitch(coordinator, entry.entry_id),
+            )
         )
     )
 
@@ -34,6 +36,7 @@ class StoutPlusSwitch(StoutPlusEntity, SwitchEntity):
     """Base class for a writable boiler switch."""
 
     async def _async_write(self, enabled: bool) -> None:
+        """Send the new state to the boiler."""
         raise NotImplementedError
 
     async def async_turn_on(self, **kwargs: object) -> None:
@@ -41,14 +44,12 @@ class StoutPlusSwitch(StoutPlusEntity, SwitchEntity):
             await self._async_write(True)
         except StoutPlusApiError as err:
             raise HomeAssistantError("Could not enable the Stout Plus option") from err
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: object) -> None:
         try:
             await self._async_write(False)
         except StoutPlusApiError as err:
             raise HomeAssistantError("Could not disable the Stout Plus option") from err
-        await self.coordinator.async_request_refresh()
 
 
 class StoutPlusDhwSwitch(StoutPlusSwitch):
@@ -57,6 +58,7 @@ class StoutPlusDhwSwitch(StoutPlusSwitch):
     _attr_translation_key = "domestic_hot_water"
     _attr_icon = "mdi:water-boiler"
     _endpoint = "main"
+    _source_keys = (("main", "settedDHWmode"),)
 
     def __init__(self, coordinator: StoutPlusCoordinator, entry_id: str) -> None:
         super().__init__(coordinator, entry_id)
@@ -64,13 +66,15 @@ class StoutPlusDhwSwitch(StoutPlusSwitch):
 
     @property
     def is_on(self) -> bool | None:
-        try:
-            return bool(int(self.coordinator.data["main"]["settedDHWmode"]))
-        except (KeyError, TypeError, ValueError):
-            return None
+        value = self.coordinator.data.field("main", "settedDHWmode").integer
+        return None if value is None else bool(value)
 
     async def _async_write(self, enabled: bool) -> None:
-        await self.coordinator.api.async_post_text("switch_dhw", f"[{int(enabled)}]")
+        await self.coordinator.writer.async_send_text(
+            "switch_dhw",
+            f"[{int(enabled)}]",
+            {("main", "settedDHWmode"): str(int(enabled))},
+        )
 
 
 class StoutPlusAntiLegionellaSwitch(StoutPlusSwitch):
@@ -79,6 +83,7 @@ class StoutPlusAntiLegionellaSwitch(StoutPlusSwitch):
     _attr_translation_key = "anti_legionella"
     _attr_icon = "mdi:bacteria-outline"
     _endpoint = "other"
+    _source_keys = (("other", "Antil_trn"),)
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator: StoutPlusCoordinator, entry_id: str) -> None:
@@ -87,13 +92,12 @@ class StoutPlusAntiLegionellaSwitch(StoutPlusSwitch):
 
     @property
     def is_on(self) -> bool | None:
-        try:
-            return bool(int(self.coordinator.data["other"]["Antil_trn"]))
-        except (KeyError, TypeError, ValueError):
-            return None
+        value = self.coordinator.data.field("other", "Antil_trn").integer
+        return None if value is None else bool(value)
 
     async def _async_write(self, enabled: bool) -> None:
-        await self.coordinator.api.async_post_form(
+        await self.coordinator.writer.async_send_form(
             "apply_alig_page",
             {"Antil_trn": "Включен" if enabled else "Выключен"},
+            {("other", "Antil_trn"): str(int(enabled))},
         )
@@ -15,7 +15,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .api import StoutPlusApiError
 from .const import DOMAIN
 from .coordinator import StoutPlusCoordinator
-from .entity import StoutPlusEntity
+from .entity import StoutPlusEntity, supported_entities
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -63,8 +63,10 @@ async def async_setup_entry(
     """Set up time entities."""
     coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        StoutPlusTime(coordinator, entry.entry_id, description)
-        for description in TIME_ENTITIES
+        supported_entities(
+            StoutPlusTime(coordinator, entry.entry_id, description)
+            for description in TIME_ENTITIES
+        )
     )
 
 
@@ -82,30 +84,29 @@ class StoutPlusTime(StoutPlusEntity, TimeEntity):
     ) -> None:
         super().__init__(coordinator, entry_id)
         self.entity_description = description
+        self._source_keys = (("other", description.source_key),)
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{description.key}"
 
     @property
     def native_value(self) -> time | None:
-        value = self.coordinator.data["other"].get(self.entity_description.source_key)
+        field = self.coordinator.data.field("other", self.entity_description.source_key)
         try:
             if self.entity_description.hour_only:
-                return time(hour=int(value))
-            return time.fromisoformat(str(value))
-        except (TypeError, ValueError):
+                return None if field.integer is None else time(hour=field.integer)
+            return None if field.raw is None else time.fromisoformat(str(field.raw))
+        except ValueError:
             return None
 
     async def async_set_value(self, value: time) -> None:
+        description = self.entity_description
+        submitted = (
+            str(value.hour) if description.hour_only else value.strftime("%H:%M")
+        )
         try:
-            await self.coordinator.api.async_post_form(
-                self.entity_description.command,
-                {
-                    self.entity_description.source_key: (
-                        str(value.hour)
-                        if self.entity_description.hour_only
-                        else value.strftime("%H:%M")
-                    )
-                },
+            await self.coordinator.writer.async_send_form(
+                description.command,
+                {description.source_key: submitted},
+                {("other", description.source_key): submitted},
             )
         except StoutPlusApiError as err:
             raise HomeAssistantError("Could not set the Stout Plus schedule") from err
-        await self.coordinator.async_request_refresh()
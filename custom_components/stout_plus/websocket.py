@@ -0,0 +1,151 @@
+"""Websocket commands of the Stout Plus integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SUBSCRIPTIONS, DOMAIN
+from .coordinator import StoutPlusCoordinator, async_get_coordinator
+from .services import HISTORY_WINDOW_SCHEMA, history_window
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_history)
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@callback
+def _async_get_coordinator(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> StoutPlusCoordinator | None:
+    """Return the coordinator of the requested entry, or report it missing."""
+    if (coordinator := async_get_coordinator(hass, msg["entry_id"])) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded"
+        )
+    return coordinator
+
+
+@callback
+def _async_entry_subscriptions(
+    hass: HomeAssistant, coordinator: StoutPlusCoordinator
+) -> set[Callable[[], None]]:
+    """Return the callbacks ending the subscriptions to an entry.
+
+    They are all called, once, when the entry is unloaded.
+    """
+    subscriptions: dict[str, set[Callable[[], None]]] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_SUBSCRIPTIONS, {})
+    entry = coordinator.config_entry
+    if (ends := subscriptions.get(entry.entry_id)) is None:
+        ends = subscriptions[entry.entry_id] = set()
+
+        @callback
+        def async_end_all() -> None:
+            for end in subscriptions.pop(entry.entry_id):
+                end()
+
+        entry.async_on_unload(async_end_all)
+    return ends
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "stout_plus/history",
+        vol.Required("entry_id"): str,
+        **HISTORY_WINDOW_SCHEMA,
+    }
+)
+@callback
+def websocket_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return recent values of the numeric fields of a boiler."""
+    if coordinator := _async_get_coordinator(hass, connection, msg):
+        connection.send_result(msg["id"], history_window(coordinator, msg))
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "stout_plus/snapshot", vol.Required("entry_id"): str}
+)
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return every decoded field of a boiler in one message."""
+    if coordinator := _async_get_coordinator(hass, connection, msg):
+        connection.send_result(msg["id"], coordinator.data.as_dict())
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "stout_plus/subscribe", vol.Required("entry_id"): str}
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send every decoded field of a boiler, then the changed ones per update.
+
+    The first event holds the whole snapshot like ``stout_plus/snapshot``;
+    later events only hold the fields that changed in an update, along with
+    the available endpoints and whether the data is stale. When the entry is
+    unloaded or reloaded, a final ``{"unloaded": true}`` event ends the
+    subscription.
+    """
+    if not (coordinator := _async_get_coordinator(hass, connection, msg)):
+        return
+    sent = coordinator.data
+
+    @callback
+    def async_send_changes() -> None:
+        nonlocal sent
+        data, previous = coordinator.data, sent
+        if data is previous:
+            return
+        sent = data
+        changed = data.changed_keys(previous)
+        if (
+            changed
+            or data.available != previous.available
+            or data.stale != previous.stale
+        ):
+            connection.send_message(
+                websocket_api.event_message(msg["id"], data.as_dict(changed))
+            )
+
+    # A listener without a context is notified after every update.
+    remove_listener = coordinator.async_add_listener(async_send_changes)
+    ends = _async_entry_subscriptions(hass, coordinator)
+
+    @callback
+    def async_unsubscribe() -> None:
+        remove_listener()
+        ends.discard(async_end)
+
+    @callback
+    def async_end() -> None:
+        connection.subscriptions.pop(msg["id"], None)
+        remove_listener()
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"unloaded": True})
+        )
+
+    ends.add(async_end)
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], sent.as_dict()))
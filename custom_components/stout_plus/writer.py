@@ -0,0 +1,226 @@
+"""Coalescing write queue for Stout Plus boiler commands."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from collections.abc import Coroutine, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .api import StoutPlusApiError
+from .const import WRITE_DEBOUNCE, WRITE_VERIFY_ATTEMPTS, WRITE_VERIFY_DELAY
+
+if TYPE_CHECKING:
+    from .coordinator import StoutPlusCoordinator
+
+# (endpoint, key) -> raw value the boiler reports once the command is applied.
+FieldUpdates = Mapping[tuple[str, str], str]
+# Command name, text payload or form fields, and the values it writes.
+BatchCommand = tuple[str, str | Mapping[str, str], FieldUpdates]
+
+
+class StoutPlusWriteError(StoutPlusApiError):
+    """The boiler accepted a command but does not report the written values."""
+
+
+class _PendingCommand:
+    """The latest payload or merged form waiting to be sent for one command."""
+
+    __slots__ = ("done", "form", "handle", "payload", "updates")
+
+    def __init__(
+        self, done: asyncio.Future[None], form: dict[str, str] | None = None
+    ) -> None:
+        self.done = done
+        self.form = form
+        self.handle: asyncio.TimerHandle
+        self.payload = ""
+        self.updates: dict[tuple[str, str], str] = {}
+
+
+class StoutPlusWriter:
+    """Send boiler commands with debouncing and no-op suppression.
+
+    Writes of the same command within ``WRITE_DEBOUNCE`` seconds are merged:
+    a text command posts only the last payload, a form posts the union of
+    the submitted fields. A text write is skipped when the boiler already
+    reports the requested value, and sends of one command never overlap.
+    The written values are shown optimistically right away. After a send
+    only the endpoints holding the written keys are read again, a few times
+    if needed, until the boiler reports the written values; a command the
+    boiler ignored fails with ``StoutPlusWriteError``.
+    """
+
+    def __init__(self, coordinator: StoutPlusCoordinator) -> None:
+        """Initialize the writer."""
+        self._coordinator = coordinator
+        self._pending: dict[str, _PendingCommand] = {}
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def async_send_text(
+        self, command: str, payload: str, updates: FieldUpdates
+    ) -> None:
+        """Queue a text command and wait until it was sent or skipped."""
+        coordinator = self._coordinator
+        pending = self._pending.get(command)
+        if pending is None:
+            # While a send is in flight the reported values may be outdated.
+            if not self._locks[command].locked() and coordinator.is_current(updates):
+                return
+            pending = _PendingCommand(coordinator.hass.loop.create_future())
+            self._pending[command] = pending
+        else:
+            pending.handle.cancel()
+            coordinator.async_clear_optimistic(pending.updates, publish=False)
+
+        pending.payload = payload
+        pending.updates = dict(updates)
+        await self._async_queue(command, pending)
+
+    async def async_send_form(
+        self, command: str, data: Mapping[str, str], updates: FieldUpdates
+    ) -> None:
+        """Queue form fields and wait until the merged form was sent."""
+        pending = self._pending.get(command)
+        if pending is None:
+            pending = _PendingCommand(
+                self._coordinator.hass.loop.create_future(), form=dict(data)
+            )
+            self._pending[command] = pending
+        else:
+            pending.handle.cancel()
+            pending.form = {**(pending.form or {}), **data}
+
+        pending.updates.update(updates)
+        await self._async_queue(command, pending)
+
+    async def async_send_batch(self, commands: Iterable[BatchCommand]) -> None:
+        """Send several commands one after another, without debouncing.
+
+        All written values are verified together at the end. When a command
+        fails, the endpoints of the commands sent before it are read again
+        once and the remaining commands are dropped.
+        """
+        coordinator = self._coordinator
+        written: dict[tuple[str, str], str] = {}
+        try:
+            for command, payload, updates in commands:
+                async with self._locks[command]:
+                    coordinator.async_set_optimistic(updates)
+                    await self._async_post(
+                        updates,
+                        coordinator.api.async_post_text(command, payload)
+                        if isinstance(payload, str)
+                        else coordinator.api.async_post_form(command, payload),
+                    )
+                written.update(updates)
+        except StoutPlusApiError:
+            if written:
+                await coordinator.async_refresh_endpoints(
+                    *{endpoint for endpoint, _ in written}
+                )
+            raise
+        if written:
+            await self._async_verify(written)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop every queued command, e.g. when the entry is unloaded."""
+        for pending in self._pending.values():
+            pending.handle.cancel()
+            pending.done.cancel()
+        self._pending.clear()
+
+    async def _async_queue(self, command: str, pending: _PendingCommand) -> None:
+        """(Re)start the send timer of a command and wait for the send."""
+        coordinator = self._coordinator
+        pending.handle = coordinator.hass.loop.call_later(
+            WRITE_DEBOUNCE, self._async_flush_later, command
+        )
+        coordinator.async_set_optimistic(pending.updates)
+        await asyncio.shield(pending.done)
+
+    @callback
+    def _async_flush_later(self, command: str) -> None:
+        # Later writes of the same command start a new batch from here on.
+        pending = self._pending.pop(command)
+        entry = self._coordinator.config_entry
+        entry.async_create_background_task(
+            self._coordinator.hass,
+            self._async_flush(command, pending),
+            f"{entry.title} {command}",
+        )
+
+    async def _async_flush(self, command: str, pending: _PendingCommand) -> None:
+        coordinator = self._coordinator
+        async with self._locks[command]:
+            if pending.form is None and coordinator.is_current(pending.updates):
+                coordinator.async_clear_optimistic(pending.updates)
+                pending.done.set_result(None)
+                return
+            try:
+                await self._async_send(
+                    pending.updates,
+                    coordinator.api.async_post_text(command, pending.payload)
+                    if pending.form is None
+                    else coordinator.api.async_post_form(command, pending.form),
+                )
+            except StoutPlusApiError as err:
+                pending.done.set_exception(err)
+            else:
+                pending.done.set_result(None)
+
+    async def _async_send(
+        self, updates: FieldUpdates, post: Coroutine[Any, Any, None]
+    ) -> None:
+        """Await a POST, then verify that the boiler applied it."""
+        await self._async_post(updates, post)
+        await self._async_verify(updates)
+
+    async def _async_post(
+        self, updates: FieldUpdates, post: Coroutine[Any, Any, None]
+    ) -> None:
+        """Await a POST and drop the optimistic values it sent."""
+        coordinator = self._coordinator
+        try:
+            await post
+        except StoutPlusApiError:
+            coordinator.async_clear_optimistic(updates)
+            raise
+        coordinator.async_clear_optimistic(updates, publish=False)
+
+    async def _async_verify(self, updates: FieldUpdates) -> None:
+        """Re-read the endpoints of the written keys until they report them.
+
+        Raise ``StoutPlusWriteError`` when the values are still not reported
+        after ``WRITE_VERIFY_ATTEMPTS`` reads, and ``StoutPlusApiError`` when
+        an endpoint could not be read back at all.
+        """
+        coordinator = self._coordinator
+        endpoints = {endpoint for endpoint, _ in updates}
+        for attempt in range(WRITE_VERIFY_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(WRITE_VERIFY_DELAY)
+            started = time.monotonic()
+            await coordinator.async_refresh_endpoints(*endpoints)
+            # Values left over from an earlier read say nothing about the write.
+            if not coordinator.last_update_success:
+                raise StoutPlusApiError(
+                    f"Could not read back the write: {coordinator.last_exception}"
+                ) from coordinator.last_exception
+            for endpoint in sorted(endpoints):
+                if (error := coordinator.read_error(endpoint, started)) is not None:
+                    raise StoutPlusApiError(
+                        f"Could not read back the write: {error}"
+                    ) from error
+            if coordinator.is_current(updates):
+                return
+        ignored = sorted(
+            key
+            for (endpoint, key), value in updates.items()
+            if not coordinator.is_current({(endpoint, key): value})
+        )
+        raise StoutPlusWriteError(f"The boiler did not apply {', '.join(ignored)}")
@@ -0,0 +1 @@
+"""Tests for the Stout Plus integration."""
@@ -0,0 +1 @@
+"""Benchmarks for the Stout Plus update and state-write hot paths."""
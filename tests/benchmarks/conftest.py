@@ -0,0 +1,58 @@
+"""Fixtures for the Stout Plus benchmarks.
+
+The benchmarks are skipped unless ``STOUT_PLUS_BENCHMARK=1`` is set::
+
+    STOUT_PLUS_BENCHMARK=1 PYTHONPATH=. pytest tests/benchmarks
+
+Results are written as JSON to ``STOUT_PLUS_BENCHMARK_REPORT``, by default
+``benchmark-report.json`` in the working directory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from homeassistant.const import __version__ as HA_VERSION
+
+REPORT_ENV = "STOUT_PLUS_BENCHMARK_REPORT"
+
+
+@pytest.fixture(scope="session")
+def benchmark_report() -> Generator[dict[str, dict[str, Any]]]:
+    """Collect benchmark results and write them out after the session."""
+    results: dict[str, dict[str, Any]] = {}
+    yield results
+    if not results:
+        return
+    report = {
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "homeassistant": HA_VERSION,
+        "benchmarks": results,
+    }
+    path = Path(os.environ.get(REPORT_ENV, "benchmark-report.json"))
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def record_benchmark(
+    benchmark_report: dict[str, dict[str, Any]],
+) -> Callable[..., None]:
+    """Return a function that records the timing of one benchmark."""
+
+    def record(name: str, iterations: int, elapsed: float, **extra: Any) -> None:
+        benchmark_report[name] = {
+            "iterations": iterations,
+            "total_s": round(elapsed, 6),
+            "per_iteration_us": round(elapsed / iterations * 1e6, 3),
+            **extra,
+        }
+
+    return record
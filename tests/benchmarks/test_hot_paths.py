@@ -0,0 +1,155 @@
+"""Benchmarks of polling, state evaluation and state writes."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable
+from time import perf_counter
+
+import pytest
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stout_plus.const import DOMAIN, ENDPOINTS
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+from custom_components.stout_plus.snapshot import StoutPlusSnapshot
+
+from ..const import ADDITIONAL, MAIN, OTHER
+
+BENCHMARK_ENV = "STOUT_PLUS_BENCHMARK"
+pytestmark = pytest.mark.skipif(
+    os.environ.get(BENCHMARK_ENV) != "1",
+    reason=f"set {BENCHMARK_ENV}=1 to run the benchmarks",
+)
+
+UPDATE_CYCLES = 2000
+SNAPSHOTS = 500
+WRITE_ROUNDS = 20
+
+
+def _main(index: int) -> dict[str, str]:
+    return {
+        **MAIN,
+        "ActValTempCarrier": f"{20 + index % 10}.5",
+        "TempInRoom": f"{18 + index % 5}.0",
+    }
+
+
+def _other(index: int) -> dict[str, str]:
+    return {**OTHER, "CurrPwr_str": f"{index % 4 * 1.5:.1f}"}
+
+
+async def test_update_data_throughput(
+    coordinator: StoutPlusCoordinator,
+    responses: dict,
+    record_benchmark: Callable[..., None],
+) -> None:
+    """Run full update cycles against the stubbed API."""
+    start = perf_counter()
+    for cycle in range(UPDATE_CYCLES):
+        # Fresh payloads, as the API decodes a new object on every request.
+        responses["main_params"] = _main(cycle)
+        responses["other_params"] = _other(cycle)
+        responses["additional_params"] = dict(ADDITIONAL)
+        coordinator.async_invalidate()
+        coordinator.data = await coordinator._async_update_data()
+    elapsed = perf_counter() - start
+
+    record_benchmark(
+        "update_data",
+        UPDATE_CYCLES,
+        elapsed,
+        cycles_per_s=round(UPDATE_CYCLES / elapsed, 1),
+    )
+
+
+async def test_state_property_cost(
+    hass: HomeAssistant,
+    coordinator: StoutPlusCoordinator,
+    record_benchmark: Callable[..., None],
+) -> None:
+    """Evaluate the state of every entity for a series of snapshots."""
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+    snapshots = [
+        StoutPlusSnapshot(
+            {"main": _main(index), "other": _other(index), "additional": ADDITIONAL},
+            frozenset(ENDPOINTS),
+        )
+        for index in range(SNAPSHOTS)
+    ]
+
+    start = perf_counter()
+    for snapshot in snapshots:
+        coordinator.data = snapshot
+        states = [(entity.state, entity.state_attributes) for entity in entities]
+    elapsed = perf_counter() - start
+
+    assert len(states) == len(entities)
+    record_benchmark(
+        "state_properties",
+        SNAPSHOTS,
+        elapsed,
+        entities=len(entities),
+        per_entity_us=round(elapsed / SNAPSHOTS / len(entities) * 1e6, 3),
+    )
+
+
+@pytest.mark.parametrize("entries", [1, 10, 100])
+async def test_state_write_cost(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    responses: dict,
+    record_benchmark: Callable[..., None],
+    entries: int,
+) -> None:
+    """Refresh every boiler of a fleet and write the changed states."""
+    coordinators: list[StoutPlusCoordinator] = []
+    for index in range(entries):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Stout Plus {index}",
+            data={"host": f"192.0.2.{index + 1}"},
+            unique_id=f"stoutplus_{index}",
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        coordinators.append(hass.data[DOMAIN][entry.entry_id])
+    await hass.async_block_till_done()
+
+    state_changes = 0
+
+    @callback
+    def count(_event: Event) -> None:
+        nonlocal state_changes
+        state_changes += 1
+
+    unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, count)
+    start = perf_counter()
+    for write_round in range(1, WRITE_ROUNDS + 1):
+        responses["main_params"] = _main(write_round)
+        responses["other_params"] = _other(write_round)
+        for coordinator in coordinators:
+            coordinator.async_invalidate("main", "other")
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators)
+        )
+        await hass.async_block_till_done()
+    elapsed = perf_counter() - start
+    unsubscribe()
+
+    assert state_changes
+    record_benchmark(
+        f"state_write_{entries}_entries",
+        WRITE_ROUNDS,
+        elapsed,
+        entries=entries,
+        state_changes=state_changes,
+        per_entry_us=round(elapsed / WRITE_ROUNDS / entries * 1e6, 3),
+    )
@@ -0,0 +1,120 @@
+"""Fixtures for the Stout Plus tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from unittest.mock import patch
+
+import pytest
+from aiohttp import ClientSession, web
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stout_plus.api import StoutPlusApi
+from custom_components.stout_plus.const import DOMAIN
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+
+from .const import RESPONSES
+from .simulator import SimulatedBoiler, apply_form, apply_text
+
+
+@pytest.fixture
+def requested() -> list[str]:
+    """Return the endpoints requested from the boiler."""
+    return []
+
+
+@pytest.fixture
+def responses(requested: list[str]) -> Generator[dict[str, dict | Exception]]:
+    """Serve boiler responses, or errors to raise, that a test may change."""
+    served = dict(RESPONSES)
+
+    async def fake_get(_api: StoutPlusApi, endpoint: str) -> dict:
+        requested.append(endpoint)
+        response = served[endpoint]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    with patch.object(StoutPlusApi, "async_get", fake_get):
+        yield served
+
+
+@pytest.fixture
+def posted(
+    responses: dict[str, dict | Exception],
+) -> Generator[list[tuple[str, str | dict[str, str]]]]:
+    """Apply the commands posted to the boiler to the served responses.
+
+    Return the posted commands in the order they were sent.
+    """
+    commands: list[tuple[str, str | dict[str, str]]] = []
+
+    def apply(command: str, payload: str | dict[str, str]) -> None:
+        commands.append((command, payload))
+        state = {
+            endpoint.removesuffix("_params"): dict(response)
+            for endpoint, response in responses.items()
+            if not isinstance(response, Exception)
+        }
+        if isinstance(payload, str):
+            apply_text(state, command, payload)
+        else:
+            apply_form(state, payload)
+        for endpoint, response in state.items():
+            if response != responses[f"{endpoint}_params"]:
+                responses[f"{endpoint}_params"] = response
+
+    async def post_text(_api: StoutPlusApi, command: str, payload: str) -> None:
+        apply(command, payload)
+
+    async def post_form(_api: StoutPlusApi, command: str, data: dict[str, str]) -> None:
+        apply(command, dict(data))
+
+    with (
+        patch.object(StoutPlusApi, "async_post_text", post_text),
+        patch.object(StoutPlusApi, "async_post_form", post_form),
+    ):
+        yield commands
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, enable_custom_integrations: None, responses: dict
+) -> StoutPlusCoordinator:
+    """Set up a boiler and return its coordinator."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stout Plus",
+        data={"host": "192.0.2.1"},
+        unique_id="stoutplus_test",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+@pytest.fixture
+async def serve_boiler(
+    hass: HomeAssistant, socket_enabled: None
+) -> AsyncGenerator[Callable[[SimulatedBoiler], Awaitable[StoutPlusApi]]]:
+    """Serve simulated boilers on localhost and return API clients for them.
+
+    The servers and clients run in the Home Assistant test loop.
+    """
+    session = ClientSession()
+    runners: list[web.AppRunner] = []
+
+    async def serve(boiler: SimulatedBoiler) -> StoutPlusApi:
+        runner = web.AppRunner(boiler.app, access_log=None)
+        await runner.setup()
+        runners.append(runner)
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        _, port = runner.addresses[0][:2]
+        return StoutPlusApi(session, f"127.0.0.1:{port}")
+
+    yield serve
+    await session.close()
+    for runner in runners:
+        await runner.cleanup()
@@ -0,0 +1,86 @@
+"""Boiler responses shared by the Stout Plus tests."""
+
+# ruff: noqa: RUF001
+
+MAIN = {
+    "Err_str": "<p>Работает без ошибок</p>",
+    "Err_Lst": "",
+    "Err_Rel_Lst": "",
+    "PowerLevels_str": "6",
+    "FullPwr_str": "9.0",
+    "settedDHWmode": "0",
+    "settedTemperatureOfDHW": "",
+    "temperatureOfDHW": "",
+    "DHWLevel": "2",
+    "exManagStatus": "0",
+    "setMode": "4",
+    "ModeStat": "<p>Текущий режим: Антизамерзание</p>",
+    "SetTempCarrier": "30.0",
+    "ActValTempCarrier": "24.7",
+    "SetDepNumber": "2",
+    "TempOutAir": "29.1",
+    "setTempRoomMode": "24.3",
+    "TempInRoom": "27.3",
+}
+
+OTHER = {
+    "PowerLevels_str": "6",
+    "FullPwr_str": "9.0",
+    "CurrPwr_str": "0.0",
+    "exManagStatus": "0",
+    "amountActiveLevelsAtNight": "4",
+    "amountActiveLevelsPerDay": "4",
+    "nightTime": "23:00",
+    "dayTime": "07:00",
+    "OutAirSensor": "<p>Уличный датчик: Подключен</p>",
+    "InAirSensor": "<p>Комнатный датчик: Подключен</p>",
+    "DomHotWatSensor": "<p>Датчик температуры ГВС: Отключен</p>",
+    "exManagMode": "0",
+    "Antil_trn": "0",
+    "Antil_temp": "0",
+    "Antil_wday_str": "0",
+    "set_time_legionella": "3",
+    "Antil_stat_str": "<p>Статус работы в данный момент: Не активен</p>",
+    "SetMaxTempCarrier": "40.0",
+    "srcMQTT": "0",
+    "PumpLag": "128",
+    "PmpStat": "0",
+    "Alg": "4",
+    "gist": "0.4",
+    "warn": "0",
+    "ActPress": "<p>Текущее давление: 1.75</p>",
+    "RTCStatus": "<p>Внутренние часы (RTC): Работают</p>",
+}
+
+ADDITIONAL = {
+    "boilerControllerSoft": "<p>Контроллера котла: 00.01.006</p>",
+    "boilerRemoteSoft": "<p>Пульта управления: 02.04.001</p>",
+    "minDHWTemp": "<p>Минимальная, °C: 40.0</p>",
+    "maxDHWTemp": "<p>Максимальная, °C: 75.0</p>",
+    "MinPress": "<p>Минимальное, бар: 1.15</p>",
+    "MaxPress": "<p>Максимальное, бар: 2.60</p>",
+    "MaxWarmCarrier": "<p>Максимальная, °C: 40.0</p>",
+    "MinWarmCarrier": "<p>Минимальная, °C: 8.0</p>",
+    "MinTempInRoom": "<p>Минимальная, °C: 0.0</p>",
+    "MaxTempInRoom": "<p>Максимальная, °C: 35.0</p>",
+    "OverHeatSensor": "<p>Датчик температуры теплоносителя: Подключен</p>",
+    "PressureSensor": "<p>Датчик давления: Подключен</p>",
+    "Sens0": "Состояние: Подключен",
+    "SensMode0": "<p>Режим: Комнатный</p>",
+    "SensTemp0": "<p>Температура: 27.3</p>",
+    "Sens1": "Состояние: Отключен",
+    "SensMode1": "<p>Режим: Комнатный</p>",
+    "SensTemp1": "<p>Температура: </p>",
+    "Sens2": "Состояние: Подключен",
+    "SensMode2": "<p>Режим: Уличный</p>",
+    "SensTemp2": "<p>Температура: 29.1</p>",
+    "Sens3": "Состояние: Подключен",
+    "SensMode3": "<p>Режим: Не задан</p>",
+    "SensTemp3": "<p>Температура: 0.0</p>",
+}
+
+RESPONSES = {
+    "main_params": MAIN,
+    "other_params": OTHER,
+    "additional_params": ADDITIONAL,
+}
@@ -0,0 +1,230 @@
+"""Simulated Stout Plus boilers for load and fault testing.
+
+Each :class:`SimulatedBoiler` serves ``main_params``, ``other_params`` and
+``additional_params`` in the boiler's HTML-in-JSON format and applies the
+text and form commands sent by the integration to its state. Latency,
+dropped connections, hanging requests, malformed JSON and a limit on
+concurrent connections can be injected through :class:`BoilerFaults`.
+
+Run a fleet of boilers on consecutive ports with::
+
+    PYTHONPATH=. python -m tests.simulator --count 10 --port 8081 --latency 0.05
+
+and add them to Home Assistant as ``127.0.0.1:8081``, ``127.0.0.1:8082``...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from aiohttp import web
+
+from custom_components.stout_plus.select import FORM_SELECTS, POWER_OPTIONS
+
+from .const import ADDITIONAL, MAIN, OTHER
+
+# Text command -> (endpoint, key, conversion of the posted value).
+TEXT_COMMANDS: dict[str, tuple[str, str, Callable[[str], str]]] = {
+    "switch_mode": ("main", "setMode", str),
+    "change_crrtrg": ("main", "SetTempCarrier", lambda value: f"{float(value):.1f}"),
+    "change_rmtrg": ("main", "setTempRoomMode", lambda value: f"{float(value):.1f}"),
+    "change_dhwtrg": (
+        "main",
+        "settedTemperatureOfDHW",
+        lambda value: f"{float(value):.1f}",
+    ),
+    "change_outtrg": ("main", "SetDepNumber", str),
+    "switch_dhw": ("main", "settedDHWmode", str),
+    "change_pwrlst": ("main", "DHWLevel", lambda value: str(int(value) + 1)),
+    "change_gist": ("other", "gist", lambda value: f"{float(value):.1f}"),
+    "switch_manage": ("other", "exManagMode", str),
+    "mqtt_rem_src": ("other", "srcMQTT", str),
+    "switch_voice": ("other", "warn", str),
+}
+FORM_COMMANDS = ("apply_alig_page", "apply_power_day", "apply_other_page")
+# Form field -> the labels whose index the boiler reports.
+FORM_CHOICES: dict[str, tuple[str, ...]] = {
+    description.source_key: description.payload_values for description in FORM_SELECTS
+}
+FORM_CHOICES["Antil_trn"] = ("Выключен", "Включен")
+# Form fields with bits outside the option index that must be preserved.
+FORM_MASKS = {
+    description.source_key: description.index_mask
+    for description in FORM_SELECTS
+    if description.index_mask is not None
+}
+POWER_FIELDS = ("amountActiveLevelsPerDay", "amountActiveLevelsAtNight")
+
+
+@dataclass(kw_only=True)
+class BoilerFaults:
+    """Faults injected into every request; rates are probabilities."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    drop_rate: float = 0.0
+    timeout_rate: float = 0.0
+    malformed_rate: float = 0.0
+    # Seconds a "timed out" request hangs before it is answered.
+    hang: float = 30.0
+    # Requests served at once; further requests queue like on the device.
+    max_connections: int | None = None
+
+
+class SimulatedBoiler:
+    """One simulated boiler with its own state and HTTP application."""
+
+    def __init__(
+        self, faults: BoilerFaults | None = None, seed: int | None = None
+    ) -> None:
+        """Initialize the boiler from the test fixtures."""
+        self.faults = faults or BoilerFaults()
+        self.state: dict[str, dict[str, str]] = {
+            "main": dict(MAIN),
+            "other": dict(OTHER),
+            "additional": dict(ADDITIONAL),
+        }
+        self.commands: list[tuple[str, str | dict[str, str]]] = []
+        self._random = random.Random(seed)
+        self._connections = (
+            asyncio.Semaphore(self.faults.max_connections)
+            if self.faults.max_connections
+            else contextlib.nullcontext()
+        )
+        self.app = web.Application()
+        self.app.router.add_get("/{endpoint}_params", self._handle_get)
+        self.app.router.add_post("/{command}", self._handle_post)
+
+    async def _handle_get(self, request: web.Request) -> web.StreamResponse:
+        endpoint = request.match_info["endpoint"]
+        if endpoint not in self.state:
+            raise web.HTTPNotFound
+        async with self._connections:
+            await self._async_inject(request)
+            body = json.dumps(self.state[endpoint], ensure_ascii=False)
+            if self._random.random() < self.faults.malformed_rate:
+                body = body[: len(body) // 2]
+            return web.Response(text=body, content_type="text/plain")
+
+    async def _handle_post(self, request: web.Request) -> web.StreamResponse:
+        command = request.match_info["command"]
+        if command not in TEXT_COMMANDS and command not in FORM_COMMANDS:
+            raise web.HTTPNotFound
+        async with self._connections:
+            await self._async_inject(request)
+            try:
+                if command in TEXT_COMMANDS:
+                    payload = await request.text()
+                    self.commands.append((command, payload))
+                    apply_text(self.state, command, payload)
+                else:
+                    form = {
+                        key: str(value) for key, value in (await request.post()).items()
+                    }
+                    self.commands.append((command, form))
+                    apply_form(self.state, form)
+            except (KeyError, ValueError) as err:
+                raise web.HTTPBadRequest(text=str(err)) from err
+            return web.Response(text="OK")
+
+    async def _async_inject(self, request: web.Request) -> None:
+        faults = self.faults
+        delay = faults.latency + self._random.uniform(0, faults.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self._random.random() < faults.timeout_rate:
+            await asyncio.sleep(faults.hang)
+        if self._random.random() < faults.drop_rate and request.transport:
+            request.transport.close()
+            raise web.HTTPServiceUnavailable
+
+
+def apply_text(state: dict[str, dict[str, str]], command: str, payload: str) -> None:
+    """Apply a text command to the endpoint payloads of a boiler."""
+    endpoint, key, convert = TEXT_COMMANDS[command]
+    state[endpoint][key] = convert(payload.strip().strip("[]"))
+
+
+def apply_form(state: dict[str, dict[str, str]], form: dict[str, str]) -> None:
+    """Apply the fields of a settings form to the endpoint payloads of a boiler."""
+    other = state["other"]
+    for key, value in form.items():
+        if key in POWER_FIELDS:
+            other[key] = str(POWER_OPTIONS.index(value) + 1)
+        elif key in FORM_CHOICES:
+            index = FORM_CHOICES[key].index(value)
+            if (mask := FORM_MASKS.get(key)) is not None:
+                index |= int(other[key]) & ~mask
+            other[key] = str(index)
+        elif key in other:
+            other[key] = value
+        else:
+            raise KeyError(key)
+
+
+async def async_run_fleet(
+    count: int,
+    host: str = "127.0.0.1",
+    port: int = 8081,
+    faults: BoilerFaults | None = None,
+    seed: int | None = None,
+) -> list[web.AppRunner]:
+    """Start ``count`` boilers on consecutive ports and return their runners."""
+    runners: list[web.AppRunner] = []
+    for index in range(count):
+        boiler = SimulatedBoiler(faults, None if seed is None else seed + index)
+        runner = web.AppRunner(boiler.app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port + index).start()
+        runners.append(runner)
+    return runners
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    faults = BoilerFaults(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop,
+        timeout_rate=args.timeout,
+        malformed_rate=args.malformed,
+        hang=args.hang,
+        max_connections=args.max_connections,
+    )
+    runners = await async_run_fleet(args.count, args.host, args.port, faults, args.seed)
+    print(
+        f"Serving {args.count} boilers on {args.host}:{args.port}"
+        f"-{args.port + args.count - 1}"
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main() -> None:
+    """Run simulated boilers until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--drop", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=0.0)
+    parser.add_argument("--malformed", type=float, default=0.0)
+    parser.add_argument("--hang", type=float, default=30.0)
+    parser.add_argument("--max-connections", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
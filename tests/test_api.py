@@ -0,0 +1,56 @@
+"""API client tests."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from custom_components.stout_plus.api import (
+    FetchStrategy,
+    StoutPlusApi,
+    StoutPlusApiError,
+)
+from custom_components.stout_plus.const import STRATEGY_TRIALS
+
+from .simulator import SimulatedBoiler
+
+
+async def test_unchanged_body_reuses_payload(serve_boiler) -> None:
+    """Return the previously decoded payload while the body stays the same."""
+    boiler = SimulatedBoiler()
+    api = await serve_boiler(boiler)
+
+    first = await api.async_get("main_params")
+    assert await api.async_get("main_params") is first
+    assert api.metrics("main_params").successes == 2
+
+    boiler.state["main"]["SetTempCarrier"] = "35.0"
+    changed = await api.async_get("main_params")
+    assert changed is not first
+    assert changed["SetTempCarrier"] == "35.0"
+
+
+async def test_fetch_strategy_avoids_resets() -> None:
+    """Keep fetching sequentially from a boiler that resets parallel requests."""
+    api = StoutPlusApi(MagicMock(), "192.0.2.1")
+    in_flight = 0
+
+    async def fake_get(endpoint: str) -> dict:
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            await asyncio.sleep(0)
+            if in_flight > 1:
+                raise StoutPlusApiError("Connection reset by peer")
+            return {}
+        finally:
+            in_flight -= 1
+
+    with patch.object(api, "async_get", fake_get):
+        for _ in range(2 * STRATEGY_TRIALS):
+            assert api.strategy is None
+            await api.async_get_many(["main_params", "other_params"])
+
+    assert api.strategy is FetchStrategy.SEQUENTIAL
+    trials = api.connection_diagnostics()["trials"]
+    assert trials[FetchStrategy.CONCURRENT] == [None] * STRATEGY_TRIALS
@@ -0,0 +1,96 @@
+"""Firmware capability tests."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stout_plus.api import StoutPlusApiError
+from custom_components.stout_plus.const import DOMAIN
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+
+from .const import ADDITIONAL, OTHER
+
+
+async def test_entities_follow_firmware_fields(
+    hass, enable_custom_integrations: None, responses: dict, hass_storage: dict
+) -> None:
+    """Only create entities for the fields the firmware returns."""
+    responses["other_params"] = {
+        key: value for key, value in OTHER.items() if key != "ActPress"
+    }
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stout Plus",
+        data={"host": "192.0.2.1"},
+        unique_id="stoutplus_test",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.stout_plus_boiler_pressure") is None
+    assert hass.states.get("sensor.stout_plus_boiler_power_consumption") is not None
+    (keys,) = hass_storage[f"{DOMAIN}.capabilities"]["data"].values()
+    assert "CurrPwr_str" in keys["other"]
+    assert "ActPress" not in keys["other"]
+
+
+async def test_firmware_change_reloads(
+    hass, coordinator: StoutPlusCoordinator, responses: dict
+) -> None:
+    """Reload the entry when the boiler reports another firmware."""
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        responses["additional_params"] = {**ADDITIONAL, "DHWLevel": "3"}
+        await coordinator.async_refresh_endpoints("additional")
+        reload.assert_not_called()
+
+        responses["additional_params"] = {
+            **ADDITIONAL,
+            "boilerControllerSoft": "<p>v00.01.007</p>",
+        }
+        await coordinator.async_refresh_endpoints("additional")
+    reload.assert_called_once_with(coordinator.config_entry.entry_id)
+
+
+@pytest.mark.parametrize(
+    ("other", "reloaded"),
+    [
+        (OTHER, False),
+        ({key: value for key, value in OTHER.items() if key != "ActPress"}, True),
+    ],
+)
+async def test_firmware_reported_after_setup(
+    hass,
+    enable_custom_integrations: None,
+    responses: dict,
+    other: dict,
+    reloaded: bool,
+) -> None:
+    """Probe the firmware once reported, and reload if entities lack fields."""
+    responses["other_params"] = other
+    responses["additional_params"] = StoutPlusApiError("timeout")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stout Plus",
+        data={"host": "192.0.2.1"},
+        unique_id="stoutplus_test",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.capabilities is None
+    # Without known capabilities every entity is created.
+    assert hass.states.get("sensor.stout_plus_boiler_pressure") is not None
+
+    responses["additional_params"] = ADDITIONAL
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        await coordinator.async_refresh_endpoints("additional")
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.capabilities is not None
+    assert coordinator.firmware is not None
+    assert reload.called is reloaded
@@ -0,0 +1,50 @@
+"""Config flow tests."""
+
+from __future__ import annotations
+
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.stout_plus.const import (
+    CONF_FAST_POLL_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PUBLISH_HEARTBEAT,
+    CONF_SLOW_POLL_INTERVAL,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_PUBLISH_HEARTBEAT,
+    DEFAULT_STALE_GRACE_PERIOD,
+)
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+
+OPTIONS = {
+    "host": "192.0.2.1",
+    CONF_MIN_PUBLISH_INTERVAL: DEFAULT_MIN_PUBLISH_INTERVAL,
+    CONF_PUBLISH_HEARTBEAT: DEFAULT_PUBLISH_HEARTBEAT,
+    CONF_STALE_GRACE_PERIOD: DEFAULT_STALE_GRACE_PERIOD,
+}
+
+
+async def test_options_reject_slow_interval_below_fast(
+    hass, coordinator: StoutPlusCoordinator, requested: list[str]
+) -> None:
+    """Keep the options form open while the idle interval is the shorter one."""
+    entry = coordinator.config_entry
+    requested.clear()
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {**OPTIONS, CONF_FAST_POLL_INTERVAL: 30, CONF_SLOW_POLL_INTERVAL: 20},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_poll_intervals"}
+    # Invalid intervals are rejected without contacting the boiler.
+    assert requested == []
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {**OPTIONS, CONF_FAST_POLL_INTERVAL: 20, CONF_SLOW_POLL_INTERVAL: 30},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_FAST_POLL_INTERVAL] == 20
+    assert entry.options[CONF_SLOW_POLL_INTERVAL] == 30
@@ -0,0 +1,262 @@
+"""Coordinator tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.stout_plus.api import StoutPlusApi, StoutPlusApiError
+from custom_components.stout_plus.const import (
+    BREAKER_THRESHOLD,
+    DEFAULT_FAST_POLL_INTERVAL,
+    DEFAULT_SLOW_POLL_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    WRITE_ACTIVITY_HOLD,
+)
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+from custom_components.stout_plus.snapshot import StoutPlusSnapshot
+
+from .const import MAIN, OTHER, RESPONSES
+
+
+async def test_endpoints_follow_their_own_intervals(
+    hass, coordinator: StoutPlusCoordinator, requested: list[str]
+) -> None:
+    """Only re-read the endpoints that are due or explicitly requested."""
+    assert sorted(requested) == sorted(RESPONSES)
+    # The sample boiler idles, but the first deadlines were set while the
+    # fast interval was still in effect.
+    assert coordinator.poll_interval == timedelta(seconds=DEFAULT_SLOW_POLL_INTERVAL)
+
+    requested.clear()
+    await coordinator.async_refresh()
+    assert requested == []
+
+    coordinator.async_invalidate("other")
+    await coordinator.async_refresh()
+    assert requested == ["other_params"]
+    assert coordinator.endpoint_available("additional")
+
+    requested.clear()
+    await coordinator.async_refresh_endpoints("main")
+    assert requested == ["main_params"]
+
+
+async def test_only_changed_fields_write_state(
+    hass, freezer, coordinator: StoutPlusCoordinator, responses: dict
+) -> None:
+    """Leave entities alone when their source fields did not change."""
+    pressure = hass.states.get("sensor.stout_plus_boiler_pressure")
+
+    freezer.tick(1)
+    responses["other_params"] = {**OTHER, "CurrPwr_str": "1.5"}
+    coordinator.async_invalidate("other")
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    power = hass.states.get("sensor.stout_plus_boiler_power_consumption")
+    assert power is not None and power.state == "1.5"
+    assert (
+        hass.states.get("sensor.stout_plus_boiler_pressure").last_reported
+        == pressure.last_reported
+    )
+
+
+async def test_failing_endpoint_does_not_refresh_others(
+    hass, coordinator: StoutPlusCoordinator, responses: dict, requested: list[str]
+) -> None:
+    """Retry only the failing endpoint while the others are not due."""
+    responses["additional_params"] = StoutPlusApiError("timeout")
+    coordinator.async_invalidate("additional")
+    await coordinator.async_refresh()
+
+    requested.clear()
+    await coordinator.async_refresh()
+    assert requested == ["additional_params"]
+
+
+async def test_failing_endpoint_backs_off(
+    hass,
+    freezer,
+    coordinator: StoutPlusCoordinator,
+    responses: dict,
+    requested: list[str],
+) -> None:
+    """Stop requesting an endpoint that keeps failing, but keep the others."""
+    # The clock is frozen before setup, so the reads during setup and the
+    # breaker deadlines are measured on it too.
+    responses["additional_params"] = StoutPlusApiError("timeout")
+    for _ in range(BREAKER_THRESHOLD):
+        coordinator.async_invalidate("additional")
+        await coordinator.async_refresh()
+
+    breakers = coordinator.breaker_diagnostics()
+    assert breakers["additional"]["state"] == "open"
+    assert breakers["additional"]["retry_in"] > 0
+    assert breakers["main"]["state"] == "closed"
+
+    requested.clear()
+    coordinator.async_invalidate()
+    await coordinator.async_refresh()
+    assert sorted(requested) == ["main_params", "other_params"]
+    assert coordinator.last_update_success
+    # The last good values are kept for the grace period.
+    assert coordinator.endpoint_available("additional")
+    assert coordinator.freshness_diagnostics()["additional"]["failing"]
+
+    freezer.tick(DEFAULT_STALE_GRACE_PERIOD)
+    await coordinator.async_refresh()
+    assert not coordinator.endpoint_available("additional")
+    assert coordinator.endpoint_available("main")
+
+
+async def test_snapshot_is_saved(
+    hass, coordinator: StoutPlusCoordinator, hass_storage: dict, freezer
+) -> None:
+    """Save the latest payloads once the save delay passed."""
+    key = f"{DOMAIN}.{coordinator.config_entry.entry_id}"
+    assert key not in hass_storage
+
+    freezer.tick(SNAPSHOT_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["raw"]["other"] == OTHER
+
+
+async def test_setup_from_saved_snapshot(
+    hass, enable_custom_integrations: None, hass_storage: dict, responses: dict
+) -> None:
+    """Create the entities from saved payloads while the boiler is offline."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Stout Plus",
+        data={"host": "192.0.2.1"},
+        unique_id="stoutplus_test",
+    )
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": SNAPSHOT_STORAGE_VERSION,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"raw": {"other": {**OTHER, "CurrPwr_str": "1.5"}}},
+    }
+    for endpoint in RESPONSES:
+        responses[endpoint] = StoutPlusApiError("timeout")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: StoutPlusCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.data.stale
+    assert coordinator.data.field("other", "CurrPwr_str").raw == "1.5"
+    assert not coordinator.last_update_success
+    # The first read ran as a scheduled cycle.
+    assert coordinator.poll_lag is not None
+
+    responses.update(RESPONSES)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    power = hass.states.get("sensor.stout_plus_boiler_power_consumption")
+    assert not coordinator.data.stale
+    assert power.state == "0.0"
+    assert "stale" not in power.attributes
+
+
+def _snapshot(
+    main: dict[str, str] | None = None, other: dict[str, str] | None = None
+) -> StoutPlusSnapshot:
+    raw = {"main": {**MAIN, **(main or {})}, "other": {**OTHER, **(other or {})}}
+    return StoutPlusSnapshot(raw, frozenset(raw))
+
+
+async def test_activity_interval(
+    hass, freezer, coordinator: StoutPlusCoordinator
+) -> None:
+    """Poll fast while the boiler is busy and slowly while it idles."""
+    fast = timedelta(seconds=DEFAULT_FAST_POLL_INTERVAL)
+    slow = timedelta(seconds=DEFAULT_SLOW_POLL_INTERVAL)
+    heating = {"setMode": "0"}
+
+    # The sample boiler idles in antifreeze mode.
+    assert coordinator._activity_interval(_snapshot()) == slow
+    assert (
+        coordinator._activity_interval(_snapshot(other={"CurrPwr_str": "1.5"})) == fast
+    )
+    assert (
+        coordinator._activity_interval(
+            _snapshot(
+                other={
+                    "Antil_stat_str": "<p>Статус работы в данный момент: Активен</p>"
+                }
+            )
+        )
+        == fast
+    )
+
+    assert coordinator._activity_interval(_snapshot(heating)) == slow
+    moving = {**heating, "ActValTempCarrier": "26.0"}
+    assert coordinator._activity_interval(_snapshot(moving)) == fast
+    steady = {**heating, "ActValTempCarrier": "26.2"}
+    assert coordinator._activity_interval(_snapshot(steady)) == slow
+
+    coordinator._last_write = time.monotonic()
+    assert coordinator._activity_interval(_snapshot(steady)) == fast
+    freezer.tick(WRITE_ACTIVITY_HOLD)
+    assert coordinator._activity_interval(_snapshot(steady)) == slow
+
+
+async def test_faster_interval_pulls_update_forward(
+    hass, coordinator: StoutPlusCoordinator
+) -> None:
+    """Read the main endpoint soon after switching to a faster interval."""
+    fast = timedelta(seconds=DEFAULT_FAST_POLL_INTERVAL)
+    slow = timedelta(seconds=DEFAULT_SLOW_POLL_INTERVAL)
+    assert coordinator.poll_interval == slow
+    coordinator._next_update["main"] = time.monotonic() + slow.total_seconds()
+
+    coordinator._async_set_poll_interval(fast)
+    assert coordinator.poll_interval == fast
+    assert coordinator._next_update["main"] <= time.monotonic() + fast.total_seconds()
+
+    # Slowing down waits for the deadline already set.
+    deadline = coordinator._next_update["main"]
+    coordinator._async_set_poll_interval(slow)
+    assert coordinator.poll_interval == slow
+    assert coordinator._next_update["main"] == deadline
+
+
+async def test_refreshes_do_not_overlap(
+    hass, coordinator: StoutPlusCoordinator, requested: list[str]
+) -> None:
+    """Start an explicit re-read only after the running cycle finished."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_get(_api: StoutPlusApi, endpoint: str) -> dict:
+        requested.append(endpoint)
+        started.set()
+        await release.wait()
+        return RESPONSES[endpoint]
+
+    requested.clear()
+    coordinator.async_invalidate("main")
+    with patch.object(StoutPlusApi, "async_get", slow_get):
+        cycle = hass.async_create_task(coordinator.async_refresh())
+        await started.wait()
+        verify = hass.async_create_task(coordinator.async_refresh_endpoints("main"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert requested == ["main_params"]
+
+        release.set()
+        await asyncio.gather(cycle, verify)
+
+    assert requested == ["main_params", "main_params"]
@@ -0,0 +1,42 @@
+"""Diagnostics tests."""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+from custom_components.stout_plus.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_diagnostics(hass, coordinator: StoutPlusCoordinator) -> None:
+    """Report polling state and history without the boiler address."""
+    coordinator.api.metrics("main_params").record_parse_failure(
+        0.2, "GET main_params failed at 192.0.2.1", "invalid_json", b'{"main"'
+    )
+
+    diagnostics = await async_get_config_entry_diagnostics(
+        hass, coordinator.config_entry
+    )
+
+    assert "192.0.2.1" not in json.dumps(diagnostics)
+    assert diagnostics["entry"]["data"]["host"] == "**REDACTED**"
+    assert diagnostics["polling"]["cycles"][0]["read"] == [
+        "main",
+        "other",
+        "additional",
+    ]
+    assert diagnostics["breakers"]["main"]["state"] == "closed"
+    assert diagnostics["freshness"]["main"]["age"] >= 0
+    assert not diagnostics["freshness"]["main"]["failing"]
+    main = diagnostics["endpoints"]["main"]
+    assert main["parse_failures"] == {"invalid_json": 1}
+    assert main["last_unparsable_body"] == '{"main"'
+    assert main["latencies"] == [0.2]
+    # Bodies are recorded by the HTTP client, which the fixtures replace.
+    assert main["responses"] == []
+    assert "slot" in diagnostics["scheduler"]
+    # The first update timed one sequential fetch of all endpoints.
+    assert diagnostics["connection"]["strategy"] is None
+    assert len(diagnostics["connection"]["trials"]["sequential"]) == 1
@@ -0,0 +1,96 @@
+"""Discovery tests."""
+
+from __future__ import annotations
+
+import asyncio
+from ipaddress import ip_address, ip_network
+from unittest.mock import MagicMock, patch
+
+from homeassistant.config_entries import SOURCE_ZEROCONF
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stout_plus.api import StoutPlusApi, StoutPlusApiError
+from custom_components.stout_plus.config_flow import StoutPlusConfigFlow
+from custom_components.stout_plus.const import DOMAIN
+from custom_components.stout_plus.discovery import async_scan_network
+
+from .const import MAIN
+
+
+async def test_scan_finds_unconfigured_boilers() -> None:
+    """Probe a few hosts at a time and keep those answering like a boiler."""
+    served = {"192.0.2.3": MAIN, "192.0.2.4": {"status": "ok"}, "192.0.2.5": MAIN}
+    in_flight = peak = 0
+
+    async def fake_get(api: StoutPlusApi, endpoint: str) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0)
+            if api.host not in served:
+                raise StoutPlusApiError("timed out")
+            return served[api.host]
+        finally:
+            in_flight -= 1
+
+    with (
+        patch.object(StoutPlusApi, "async_get", fake_get),
+        patch("custom_components.stout_plus.discovery.SCAN_CONCURRENCY", 2),
+    ):
+        found = await async_scan_network(
+            MagicMock(), ip_network("192.0.2.0/29"), exclude={"192.0.2.5"}
+        )
+
+    assert found == ["192.0.2.3"]
+    assert peak == 2
+
+
+def _announcement(host: str) -> ZeroconfServiceInfo:
+    return ZeroconfServiceInfo(
+        ip_address=ip_address(host),
+        ip_addresses=[ip_address(host)],
+        hostname="stoutplus_test.local.",
+        name="stoutplus_test._http._tcp.local.",
+        port=80,
+        properties={},
+        type="_http._tcp.local.",
+    )
+
+
+async def test_zeroconf_probe_is_cached(hass, enable_custom_integrations) -> None:
+    """Probe a repeatedly announced boiler only once within the TTL."""
+    with patch.object(
+        StoutPlusConfigFlow, "_async_test_connection", return_value=False
+    ) as test_connection:
+        for _ in range(2):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_ZEROCONF},
+                data=_announcement("192.0.2.7"),
+            )
+            assert result["type"] is FlowResultType.ABORT
+            assert result["reason"] == "cannot_connect"
+
+    test_connection.assert_awaited_once_with("192.0.2.7")
+
+
+async def test_zeroconf_known_boiler_updates_host(
+    hass, enable_custom_integrations
+) -> None:
+    """Update the address of a configured boiler without probing it."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"host": "192.0.2.1"}, unique_id="stoutplus_test"
+    )
+    entry.add_to_hass(hass)
+
+    with patch.object(StoutPlusConfigFlow, "_async_test_connection") as test_connection:
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": SOURCE_ZEROCONF}, data=_announcement("192.0.2.7")
+        )
+
+    assert result["reason"] == "already_configured"
+    assert entry.data["host"] == "192.0.2.7"
+    test_connection.assert_not_awaited()
@@ -0,0 +1,51 @@
+"""History tests."""
+
+from __future__ import annotations
+
+from custom_components.stout_plus.const import DOMAIN
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+from custom_components.stout_plus.history import StoutPlusHistory
+from custom_components.stout_plus.snapshot import StoutPlusSnapshot
+
+
+def test_ring_buffer_keeps_latest_samples() -> None:
+    """Overwrite the oldest samples and select a window by time."""
+    history = StoutPlusHistory(capacity=3)
+    for second in range(5):
+        history.record(
+            1000.0 + 10 * second,
+            StoutPlusSnapshot(
+                {"main": {"ActValTempCarrier": f"2{second}.5"}}, frozenset({"main"})
+            ),
+        )
+
+    assert len(history) == 3
+    window = history.window(start=1025.0, fields=["boiler_water_temperature", "power"])
+    assert window == {
+        "timestamps": [1030.0, 1040.0],
+        "fields": {"boiler_water_temperature": [23.5, 24.5], "power": [None, None]},
+    }
+
+
+async def test_history_service_and_command(
+    hass, coordinator: StoutPlusCoordinator, hass_ws_client
+) -> None:
+    """Return the recorded updates through the service and the websocket."""
+    entry_id = coordinator.config_entry.entry_id
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_history",
+        {"config_entry_id": entry_id, "fields": ["pressure"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["fields"] == {"pressure": [1.75]}
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "stout_plus/history", "entry_id": entry_id, "fields": ["power"]}
+    )
+    message = await client.receive_json()
+    assert message["success"]
+    assert message["result"]["fields"] == {"power": [0.0]}
+    assert message["result"]["timestamps"] == response["timestamps"]
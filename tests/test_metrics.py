@@ -0,0 +1,65 @@
+"""Request metrics tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.stout_plus.api import StoutPlusApiError
+from custom_components.stout_plus.const import DIAGNOSTICS_RESPONSES
+from custom_components.stout_plus.metrics import EndpointMetrics
+
+from .simulator import SimulatedBoiler
+
+
+def test_latency_window_keeps_latest_requests() -> None:
+    """Compute percentiles over the latest requests only."""
+    metrics = EndpointMetrics(window=4)
+    assert metrics.percentile(0.5) is None
+    assert metrics.max_latency is None
+
+    for latency in (9.0, 1.0, 2.0, 3.0, 4.0):
+        metrics.record_success(latency, b"0123456789")
+
+    assert metrics.max_latency == 4.0
+    assert metrics.percentile(0.5) == 2.0
+    assert metrics.percentile(0.95) == 4.0
+    assert metrics.successes == 5
+    assert metrics.bytes_received == 50
+
+
+def test_latest_responses_are_kept() -> None:
+    """Keep the latest bodies, oldest first, with their receive times."""
+    metrics = EndpointMetrics()
+    assert metrics.responses() == []
+
+    for index in range(DIAGNOSTICS_RESPONSES + 2):
+        metrics.record_success(0.1, str(index).encode())
+
+    responses = metrics.responses()
+    assert [body for _, body in responses] == [
+        str(index).encode() for index in range(2, DIAGNOSTICS_RESPONSES + 2)
+    ]
+    assert all(received > 0 for received, _ in responses)
+
+
+async def test_api_records_requests(serve_boiler) -> None:
+    """Record successful and failed requests per endpoint."""
+    boiler = SimulatedBoiler()
+    api = await serve_boiler(boiler)
+
+    await api.async_get("main_params")
+    boiler.faults.malformed_rate = 1
+    with pytest.raises(StoutPlusApiError):
+        await api.async_get("main_params")
+
+    metrics = api.metrics("main_params")
+    assert metrics.successes == 1
+    assert metrics.failures == 1
+    ((_, body),) = metrics.responses()
+    assert body.startswith(b"{")
+    assert metrics.bytes_received > 0
+    assert metrics.last_error
+    assert metrics.parse_failures == {"invalid_json": 1}
+    assert metrics.last_unparsable_body
+    assert metrics.max_latency is not None
+    assert api.metrics("other_params").successes == 0
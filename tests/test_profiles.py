@@ -0,0 +1,75 @@
+"""Profile service tests."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.stout_plus.const import DOMAIN
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+
+from .const import MAIN, OTHER
+
+
+async def test_apply_profile_sends_only_changes(
+    hass,
+    coordinator: StoutPlusCoordinator,
+    responses: dict,
+    posted: list,
+    requested: list[str],
+) -> None:
+    """Write the differing settings, one command per form, and refresh once."""
+    entry_id = coordinator.config_entry.entry_id
+    await hass.services.async_call(
+        DOMAIN,
+        "save_profile",
+        {"config_entry_id": entry_id, "name": "winter"},
+        blocking=True,
+    )
+
+    responses["main_params"] = {**MAIN, "setMode": "0"}
+    responses["other_params"] = {
+        **OTHER,
+        "gist": "1.0",
+        "nightTime": "22:30",
+        "amountActiveLevelsAtNight": "6",
+        "Antil_trn": "1",
+    }
+    await coordinator.async_refresh_endpoints()
+    requested.clear()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "apply_profile",
+        {"config_entry_id": entry_id, "name": "winter"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "changed": [
+            "operating_mode",
+            "power_night",
+            "night_time",
+            "temperature_hysteresis_setting",
+            "anti_legionella",
+        ]
+    }
+    assert posted == [
+        ("switch_mode", "[4]"),
+        ("change_gist", "[0.4]"),
+        ("apply_power_day", {"amountActiveLevelsAtNight": "6.0", "nightTime": "23:00"}),
+        ("apply_alig_page", {"Antil_trn": "Выключен"}),
+    ]
+    assert sorted(requested) == ["main_params", "other_params"]
+
+
+async def test_apply_unknown_profile(hass, coordinator: StoutPlusCoordinator) -> None:
+    """Reject a profile that was never saved."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "apply_profile",
+            {"config_entry_id": coordinator.config_entry.entry_id, "name": "summer"},
+            blocking=True,
+        )
@@ -0,0 +1,54 @@
+"""Poll scheduler tests."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+from custom_components.stout_plus.scheduler import StoutPlusScheduler
+
+from .const import RESPONSES
+
+
+async def test_request_slots_are_capped(hass) -> None:
+    """Never exceed the per-host and the global number of requests."""
+    scheduler = StoutPlusScheduler(hass, max_in_flight=3, max_per_host=2)
+    active: dict[str, int] = {"192.0.2.1": 0, "192.0.2.2": 0}
+    peaks: list[tuple[int, int]] = []
+
+    async def request(host: str) -> None:
+        async with scheduler.async_request_slot(host):
+            active[host] += 1
+            peaks.append((max(active.values()), sum(active.values())))
+            await asyncio.sleep(0)
+            active[host] -= 1
+
+    await asyncio.gather(*(request(host) for host in active for _ in range(4)))
+
+    assert max(per_host for per_host, _ in peaks) == 2
+    assert max(total for _, total in peaks) == 3
+
+
+async def test_scheduled_cycles_report_lag(
+    hass, coordinator: StoutPlusCoordinator, requested: list[str]
+) -> None:
+    """Poll on the scheduler's timer and record how late the cycle ran."""
+    entry_id = coordinator.config_entry.entry_id
+    coordinator.scheduler.async_unregister(coordinator)
+    scheduler = StoutPlusScheduler(hass)
+    scheduler.async_register(coordinator)
+    assert scheduler.lag(entry_id) is None
+
+    requested.clear()
+    coordinator.async_invalidate()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=120))
+    # Cycles run as background tasks of the entry.
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert sorted(requested) == sorted(RESPONSES)
+    assert scheduler.lag(entry_id) is not None
+    scheduler.async_unregister(coordinator)
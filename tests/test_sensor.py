@@ -0,0 +1,41 @@
+"""Sensor tests."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.stout_plus.const import DEFAULT_PUBLISH_HEARTBEAT
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+
+from .const import OTHER
+
+
+async def test_pressure_deadband(
+    hass, coordinator: StoutPlusCoordinator, responses: dict
+) -> None:
+    """Hold back pressure changes within the deadband until the heartbeat."""
+    entity_id = "sensor.stout_plus_boiler_pressure"
+
+    async def report(pressure: str) -> None:
+        responses["other_params"] = {**OTHER, "ActPress": f"<p>{pressure}</p>"}
+        await coordinator.async_refresh_endpoints("other")
+        await hass.async_block_till_done()
+
+    await report("1.76")
+    assert hass.states.get(entity_id).state == "1.75"
+    assert coordinator.suppressed_writes == 1
+
+    await report("1.8")
+    assert hass.states.get(entity_id).state == "1.8"
+
+    await report("1.81")
+    assert hass.states.get(entity_id).state == "1.8"
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_PUBLISH_HEARTBEAT)
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "1.81"
+    assert coordinator.suppressed_writes == 2
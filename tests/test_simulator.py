@@ -0,0 +1,36 @@
+"""Boiler simulator tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.stout_plus.api import StoutPlusApiError
+
+from .simulator import BoilerFaults, SimulatedBoiler
+
+
+async def test_simulator_applies_commands(serve_boiler) -> None:
+    """Apply the integration's text and form commands to the boiler state."""
+    api = await serve_boiler(SimulatedBoiler())
+
+    await api.async_post_text("change_crrtrg", "[31.5]")
+    await api.async_post_form(
+        "apply_alig_page", {"Antil_trn": "Включен", "Antil_temp": "70°C"}
+    )
+    await api.async_post_form("apply_power_day", {"amountActiveLevelsPerDay": "6.0"})
+    await api.async_post_form("apply_other_page", {"PumpLag": "выбег 10 мин"})
+
+    assert (await api.async_get("main_params"))["SetTempCarrier"] == "31.5"
+    other = await api.async_get("other_params")
+    assert other["Antil_trn"] == "1"
+    assert other["Antil_temp"] == "1"
+    assert other["amountActiveLevelsPerDay"] == "4"
+    assert other["PumpLag"] == "130"
+
+
+async def test_simulator_serves_malformed_json(serve_boiler) -> None:
+    """Surface malformed responses as API errors."""
+    api = await serve_boiler(SimulatedBoiler(BoilerFaults(malformed_rate=1)))
+
+    with pytest.raises(StoutPlusApiError):
+        await api.async_get("main_params")
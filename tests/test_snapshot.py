@@ -0,0 +1,47 @@
+"""Snapshot decoding tests."""
+
+from __future__ import annotations
+
+from custom_components.stout_plus.snapshot import (
+    FieldFlag,
+    StoutPlusField,
+    StoutPlusSnapshot,
+)
+
+from .const import ADDITIONAL, MAIN, OTHER
+
+RAW = {"main": MAIN, "other": OTHER, "additional": ADDITIONAL}
+
+
+def test_snapshot_decodes_fields_once() -> None:
+    """Decode numbers, text and status words, and reuse unchanged fields."""
+    snapshot = StoutPlusSnapshot(RAW, frozenset(RAW))
+
+    assert snapshot.field("other", "ActPress").number == 1.75
+    assert snapshot.field("additional", "SensTemp1").number is None
+    assert snapshot.field("main", "setMode").integer == 4
+    assert snapshot.field("additional", "SensMode0").text == "Режим: Комнатный"
+    assert snapshot.field("other", "OutAirSensor").flag is FieldFlag.CONNECTED
+    assert snapshot.field("other", "DomHotWatSensor").flag is FieldFlag.DISCONNECTED
+    assert snapshot.field("main", "Err_str").flag is FieldFlag.NO_ERRORS
+    assert snapshot.field("main", "missing").raw is None
+
+    updated = StoutPlusSnapshot(
+        {**RAW, "main": {**MAIN, "setMode": "0"}}, frozenset(RAW), snapshot
+    )
+    assert updated.generation == snapshot.generation + 1
+    assert updated.field("main", "setMode").integer == 0
+    assert updated.field("other", "ActPress") is snapshot.field("other", "ActPress")
+
+    calls: list[int] = []
+    for _ in range(2):
+        updated.cached("derived", lambda data: calls.append(data.generation))
+    assert calls == [updated.generation]
+
+
+def test_field_matches_values() -> None:
+    """Compare plain numbers by value and any other text exactly."""
+    assert StoutPlusField("30").matches("30.0")
+    assert not StoutPlusField("30").matches("30.5")
+    assert StoutPlusField("07:00").matches("07:00")
+    assert not StoutPlusField("07:00").matches("07:30")
@@ -0,0 +1,85 @@
+"""Websocket command tests."""
+
+from __future__ import annotations
+
+from custom_components.stout_plus.const import DATA_SUBSCRIPTIONS, DOMAIN
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+
+from .const import OTHER
+
+
+async def test_snapshot(
+    hass, coordinator: StoutPlusCoordinator, hass_ws_client
+) -> None:
+    """Return every decoded field in one message."""
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "stout_plus/snapshot", "entry_id": coordinator.config_entry.entry_id}
+    )
+    message = await client.receive_json()
+    assert message["success"]
+    result = message["result"]
+    assert result["available"] == ["additional", "main", "other"]
+    assert result["fields"]["other"]["ActPress"]["number"] == 1.75
+    assert len(result["fields"]["main"]) == len(coordinator.data.raw["main"])
+
+
+async def test_subscribe_sends_changed_fields(
+    hass, coordinator: StoutPlusCoordinator, responses: dict, hass_ws_client
+) -> None:
+    """Send the whole snapshot first, then only the changed fields."""
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "stout_plus/subscribe", "entry_id": coordinator.config_entry.entry_id}
+    )
+    assert (await client.receive_json())["success"]
+    snapshot = (await client.receive_json())["event"]
+    assert set(snapshot["fields"]) == {"main", "other", "additional"}
+
+    # Unchanged payloads do not produce an event.
+    await coordinator.async_refresh_endpoints("other")
+    responses["other_params"] = {**OTHER, "CurrPwr_str": "1.5"}
+    await coordinator.async_refresh_endpoints("other")
+    event = (await client.receive_json())["event"]
+    assert event["fields"] == {"other": {"CurrPwr_str": {"text": "1.5", "number": 1.5}}}
+    assert event["stale"] is False
+
+
+async def test_subscription_ends_on_unload(
+    hass, coordinator: StoutPlusCoordinator, hass_ws_client
+) -> None:
+    """End the subscription when the entry is unloaded."""
+    entry = coordinator.config_entry
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "stout_plus/subscribe", "entry_id": entry.entry_id}
+    )
+    assert (await client.receive_json())["success"]
+    await client.receive_json()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    message = await client.receive_json()
+    assert message["event"] == {"unloaded": True}
+    assert not coordinator._listeners
+
+
+async def test_unsubscribe_forgets_subscription(
+    hass, coordinator: StoutPlusCoordinator, hass_ws_client
+) -> None:
+    """Keep nothing of a subscription the client ended."""
+    entry_id = coordinator.config_entry.entry_id
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "stout_plus/subscribe", "entry_id": entry_id}
+    )
+    subscription = (await client.receive_json())["id"]
+    await client.receive_json()
+    assert len(hass.data[DOMAIN][DATA_SUBSCRIPTIONS][entry_id]) == 1
+
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    assert (await client.receive_json())["success"]
+    assert not hass.data[DOMAIN][DATA_SUBSCRIPTIONS][entry_id]
@@ -0,0 +1,146 @@
+"""Write queue tests."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.stout_plus.api import StoutPlusApi, StoutPlusApiError
+from custom_components.stout_plus.const import WRITE_VERIFY_ATTEMPTS
+from custom_components.stout_plus.coordinator import StoutPlusCoordinator
+from custom_components.stout_plus.writer import StoutPlusWriteError
+
+from .const import MAIN
+
+
+async def test_writes_are_coalesced_and_no_ops_skipped(
+    hass, coordinator: StoutPlusCoordinator, posted: list
+) -> None:
+    """Send only the last of several quick writes, and nothing for no-ops."""
+    writer = coordinator.writer
+    key = ("main", "SetTempCarrier")
+
+    await writer.async_send_text("change_crrtrg", "[30.0]", {key: "30.0"})
+    assert posted == []
+
+    first = hass.async_create_task(
+        writer.async_send_text("change_crrtrg", "[30.5]", {key: "30.5"})
+    )
+    await asyncio.sleep(0)
+    await writer.async_send_text("change_crrtrg", "[31.0]", {key: "31.0"})
+    await first
+
+    assert posted == [("change_crrtrg", "[31.0]")]
+
+
+async def test_writes_show_optimistic_state(
+    hass, coordinator: StoutPlusCoordinator, responses: dict, requested: list[str]
+) -> None:
+    """Show a written value at once, revert it on failure, re-read one endpoint."""
+    key = ("main", "SetTempCarrier")
+    shown: list[float | None] = []
+
+    async def post_text(_api: StoutPlusApi, command: str, payload: str) -> None:
+        shown.append(coordinator.data.field(*key).number)
+        responses["main_params"] = {**MAIN, "SetTempCarrier": "31.0"}
+
+    requested.clear()
+    with patch.object(StoutPlusApi, "async_post_text", post_text):
+        await coordinator.writer.async_send_text(
+            "change_crrtrg", "[31.0]", {key: "31.0"}
+        )
+    assert shown == [31.0]
+    assert requested == ["main_params"]
+
+    with (
+        patch.object(
+            StoutPlusApi, "async_post_text", side_effect=StoutPlusApiError("down")
+        ),
+        pytest.raises(StoutPlusApiError),
+    ):
+        await coordinator.writer.async_send_text(
+            "change_crrtrg", "[32.0]", {key: "32.0"}
+        )
+    assert coordinator.data.field(*key).number == 31.0
+
+
+async def test_form_fields_are_merged(
+    hass, coordinator: StoutPlusCoordinator, posted: list, requested: list[str]
+) -> None:
+    """Post the fields of one form written together in a single request."""
+    writer = coordinator.writer
+    requested.clear()
+
+    await asyncio.gather(
+        writer.async_send_form(
+            "apply_alig_page",
+            {"Antil_trn": "Включен"},
+            {("other", "Antil_trn"): "1"},
+        ),
+        writer.async_send_form(
+            "apply_alig_page",
+            {"Antil_temp": "70°C"},
+            {("other", "Antil_temp"): "1"},
+        ),
+    )
+
+    assert posted == [
+        ("apply_alig_page", {"Antil_trn": "Включен", "Antil_temp": "70°C"})
+    ]
+    assert requested == ["other_params"]
+
+
+async def test_ignored_write_fails(
+    hass, coordinator: StoutPlusCoordinator, requested: list[str]
+) -> None:
+    """Fail a write the boiler accepted but still does not report."""
+    key = ("other", "gist")
+    requested.clear()
+
+    with (
+        patch.object(StoutPlusApi, "async_post_text", new_callable=AsyncMock),
+        patch("custom_components.stout_plus.writer.WRITE_VERIFY_DELAY", 0),
+        pytest.raises(StoutPlusWriteError, match="gist"),
+    ):
+        await coordinator.writer.async_send_text("change_gist", "[9.0]", {key: "9.0"})
+
+    assert requested == ["other_params"] * WRITE_VERIFY_ATTEMPTS
+    assert coordinator.data.field(*key).number == 0.4
+
+
+async def test_ignored_minutes_fail(hass, coordinator: StoutPlusCoordinator) -> None:
+    """Fail a time write of which the boiler did not apply the minutes."""
+    key = ("other", "nightTime")
+
+    with (
+        patch.object(StoutPlusApi, "async_post_form", new_callable=AsyncMock),
+        patch("custom_components.stout_plus.writer.WRITE_VERIFY_DELAY", 0),
+        pytest.raises(StoutPlusWriteError, match="nightTime"),
+    ):
+        await coordinator.writer.async_send_form(
+            "apply_power_day", {"nightTime": "23:30"}, {key: "23:30"}
+        )
+
+    assert coordinator.data.field(*key).text == "23:00"
+
+
+async def test_failed_read_back_is_not_a_rejected_write(
+    hass, coordinator: StoutPlusCoordinator, responses: dict, requested: list[str]
+) -> None:
+    """Report the read error when the written endpoint cannot be read back."""
+    key = ("other", "gist")
+
+    async def post_text(_api: StoutPlusApi, command: str, payload: str) -> None:
+        responses["other_params"] = StoutPlusApiError("timed out")
+
+    requested.clear()
+    with (
+        patch.object(StoutPlusApi, "async_post_text", post_text),
+        pytest.raises(StoutPlusApiError, match="timed out") as error,
+    ):
+        await coordinator.writer.async_send_text("change_gist", "[0.5]", {key: "0.5"})
+
+    assert not isinstance(error.value, StoutPlusWriteError)
+    assert requested == ["other_params"]